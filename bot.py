@@ -31,6 +31,11 @@ class DiscordBot(commands.Bot):
     async def setup_hook(self):
         """Setup hook called when bot is starting up"""
         try:
+            # Shared delayed deletion of bot messages (persisted, one timer task)
+            from utils.deletion_queue import DeletionQueue
+            self.deletion_queue = DeletionQueue(self)
+            self.deletion_queue.start()
+
             # Load ban list commands
             from commands.ban_list import BanListCommand
             await self.add_cog(BanListCommand(self))
@@ -55,6 +60,10 @@ class DiscordBot(commands.Bot):
             from commands.games import GamesCommands
             await self.add_cog(GamesCommands(self))
 
+            # Load temporary channels (expiry scheduler reconciles on ready)
+            from commands.temp_channels import TempChannelsCommands
+            await self.add_cog(TempChannelsCommands(self))
+
             # Load guardian system (if exists)
             try:
                 from commands.guardian import GuardianCommands
@@ -85,6 +94,12 @@ class DiscordBot(commands.Bot):
         except Exception as e:
             logger.error(f"Error in setup_hook: {e}")
 
+    async def close(self):
+        """Unload the cogs (they queue their last writes), then wait for the storage writer"""
+        await super().close()
+        from utils.storage import get_storage
+        await get_storage().flush()
+
     async def on_ready(self):
         """Called when bot is ready and connected to Discord"""
         if self.user:
@@ -7,8 +7,13 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
+import asyncio
 from utils.pagination import PaginationView
-from utils.embeds import create_ban_list_embed
+from utils.ban_cache import BanCache
+from utils.ban_audit_index import BanAuditIndex
+from utils.ban_reason_index import BanReasonIndex
+from utils.ban_snapshot import BanSnapshot
+from utils.temp_ban_scheduler import TempBanScheduler
 from config import BOT_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -16,8 +21,62 @@ logger = logging.getLogger(__name__)
 class BanListCommand(commands.Cog):
     """Cog for ban list related commands"""
 
+    # Seconds between two footer refreshes while a large ban list is still loading
+    STREAM_REFRESH_INTERVAL = 3
+
     def __init__(self, bot):
         self.bot = bot
+        self.ban_cache = BanCache(bot)
+        bot.ban_cache = self.ban_cache
+        self.audit_index = BanAuditIndex(bot)
+        bot.ban_audit_index = self.audit_index
+        self.reason_index = BanReasonIndex()
+        self.ban_cache.reason_index = self.reason_index
+        self.audit_index.reason_index = self.reason_index
+        self.temp_bans = TempBanScheduler(bot)
+        bot.temp_ban_scheduler = self.temp_bans
+        # Strong references to the streaming tasks (the loop only keeps weak ones)
+        self._stream_tasks = set()
+
+    def cog_unload(self):
+        """Stop the temp ban expiry task"""
+        self.temp_bans.stop()
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Start unbanning expired temp bans and recover the ones written in ban reasons"""
+        self.temp_bans.start()
+        for guild in self.bot.guilds:
+            if not guild.me or not guild.me.guild_permissions.ban_members:
+                continue
+            try:
+                # Also warms the ban cache, so /banlist is instant afterwards
+                bans = await self.ban_cache.get_bans(guild)
+                self.temp_bans.rebuild_from_bans(guild.id, bans)
+            except discord.HTTPException as e:
+                logger.warning(f"Could not recover temp bans for guild {guild.id}: {e}")
+
+    @commands.Cog.listener()
+    async def on_member_ban(self, guild, user):
+        """Keep the ban cache in sync with new bans"""
+        await self.ban_cache.on_member_ban(guild, user)
+
+    @commands.Cog.listener()
+    async def on_member_unban(self, guild, user):
+        """Keep the ban cache in sync with unbans"""
+        self.ban_cache.on_member_unban(guild, user)
+
+    @commands.Cog.listener()
+    async def on_audit_log_entry_create(self, entry):
+        """Index new ban audit entries as they are created"""
+        self.audit_index.on_audit_log_entry_create(entry)
+        if entry.action == discord.AuditLogAction.ban and entry.target:
+            self.ban_cache.set_reason(entry.guild.id, entry.target.id, entry.reason)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        """Forget the bans of a guild the bot has left"""
+        self.ban_cache.invalidate(guild.id)
 
     @app_commands.command(
         name="banlist",
@@ -25,9 +84,10 @@ class BanListCommand(commands.Cog):
     )
     @app_commands.describe(
         page="Numéro de page à afficher (défaut: 1)",
-        search="Rechercher un utilisateur par pseudo (optionnel)"
+        search="Rechercher un utilisateur par pseudo (optionnel)",
+        reason="Rechercher dans les raisons de ban et des logs d'audit (optionnel)"
     )
-    async def ban_list(self, interaction: discord.Interaction, page: int = 1, search: str = ""):
+    async def ban_list(self, interaction: discord.Interaction, page: int = 1, search: str = "", reason: str = ""):
         """Slash command to display banned users list with pagination"""
 
         # Check if interaction is valid
@@ -115,29 +175,50 @@ class BanListCommand(commands.Cog):
             return
 
         try:
-            # Fetch all banned users
-            banned_users = []
-            if interaction.guild:
-                async for ban_entry in interaction.guild.bans():
-                    banned_users.append(ban_entry)
-
-            # Filter by search term if provided
+            # Read banned users from the cache (fetched from the API only once per guild)
+            per_page = BOT_CONFIG['bans_per_page']
+            search_parts = []
             if search and search.strip():
-                search_lower = search.lower()
-                filtered_users = []
-                for ban_entry in banned_users:
-                    user = ban_entry.user
-                    if (search_lower in user.display_name.lower() or 
-                        search_lower in user.name.lower() or 
-                        search_lower in str(user.id)):
-                        filtered_users.append(ban_entry)
-                banned_users = filtered_users
-
-            if not banned_users:
-                if search and search.strip():
+                search_parts.append(search)
+            if reason and reason.strip():
+                search_parts.append(f"raison: {reason}")
+            search_query = " • ".join(search_parts) or None
+
+            loading = False
+            if search_query:
+                # Ranked name and/or full-text reason matches, kept as an index array
+                # over the current snapshot and shared by every view running the same search
+                snapshot = await self.ban_cache.get_snapshot(interaction.guild)
+                # Reason matches follow the full-text index, updated without a new
+                # snapshot version (audit reasons, queued writes): never memoized
+                selection = snapshot.get_selection(
+                    search_query,
+                    lambda: self.ban_cache.find_user_ids(interaction.guild.id, search, reason),
+                    memoize=not (reason and reason.strip())
+                )
+            else:
+                # Stream: render as soon as the requested page is fetched, the rest keeps loading
+                banned_users, complete = await self.ban_cache.get_first_bans(
+                    interaction.guild, max(page, 1) * per_page
+                )
+                loading = not complete
+                if complete:
+                    snapshot = await self.ban_cache.get_snapshot(interaction.guild)
+                else:
+                    snapshot = BanSnapshot(
+                        banned_users,
+                        interaction.guild.id,
+                        interaction.guild.name,
+                        audit_index=self.audit_index,
+                        loading=True
+                    )
+                selection = snapshot.full_selection
+
+            if not len(selection):
+                if search_query:
                     embed = discord.Embed(
                         title="📋 Liste des Bannis - Recherche",
-                        description=f"Aucun utilisateur banni trouvé pour la recherche: **{search}**",
+                        description=f"Aucun utilisateur banni trouvé pour la recherche: **{search_query}**",
                         color=discord.Color.orange()
                     )
                     embed.set_footer(text=f"Serveur: {interaction.guild.name} • Créé par @Ninja Iyed")
@@ -151,51 +232,33 @@ class BanListCommand(commands.Cog):
                 await interaction.followup.send(embed=embed)
                 return
 
-            # Fetch audit logs to get who banned each user
-            ban_info = {}
+            # Get who banned each user from the persisted audit index (only new entries are fetched)
             try:
-                if interaction.guild:
-                    async for entry in interaction.guild.audit_logs(action=discord.AuditLogAction.ban, limit=500):
-                        if entry.target and entry.target.id:
-                            ban_info[entry.target.id] = {
-                                'moderator': entry.user,
-                                'timestamp': entry.created_at,
-                                'reason': entry.reason
-                            }
+                await self.audit_index.refresh(interaction.guild)
             except discord.Forbidden:
-                # If we can't access audit logs, continue without moderator info
+                # If we can't access audit logs, continue with what is already indexed
                 pass
 
             # Validate page number
-            total_pages = (len(banned_users) + BOT_CONFIG['bans_per_page'] - 1) // BOT_CONFIG['bans_per_page']
+            total_pages = selection.total_pages(per_page)
             if page < 1:
                 page = 1
             elif page > total_pages:
                 page = total_pages
 
-            # Create initial embed
-            guild_name = interaction.guild.name if interaction.guild else "Unknown Server"
-            search_query = search if search and search.strip() else None
-            embed = create_ban_list_embed(
-                banned_users=banned_users,
-                page=page,
-                per_page=BOT_CONFIG['bans_per_page'],
-                guild_name=guild_name,
-                ban_info=ban_info,
-                search_term=search_query
-            )
-
             # Always create pagination view to show manage button
             view = PaginationView(
-                banned_users=banned_users,
+                selection=selection,
                 current_page=page,
-                per_page=BOT_CONFIG['bans_per_page'],
-                guild_name=guild_name,
-                user_id=interaction.user.id,
-                ban_info=ban_info,
-                search_term=search_query
+                per_page=per_page,
+                user_id=interaction.user.id
             )
-            await interaction.followup.send(embed=embed, view=view)
+            message = await interaction.followup.send(embed=view.build_embed(), view=view)
+
+            if loading:
+                task = asyncio.create_task(self.stream_remaining_bans(interaction.guild, view, message))
+                self._stream_tasks.add(task)
+                task.add_done_callback(self._stream_tasks.discard)
 
         except discord.Forbidden:
             await interaction.followup.send(
@@ -215,6 +278,34 @@ class BanListCommand(commands.Cog):
                 ephemeral=True
             )
 
+    async def stream_remaining_bans(self, guild, view, message):
+        """Keep fetching bans after the first page and refresh the view totals"""
+        load = asyncio.ensure_future(self.ban_cache.ensure_loaded(guild))
+        try:
+            while not load.done():
+                # Debounce the edits: one refresh per interval while the fetch runs
+                await asyncio.wait({load}, timeout=self.STREAM_REFRESH_INTERVAL)
+                if view.is_finished():
+                    return
+
+                if load.done():
+                    snapshot = await self.ban_cache.get_snapshot(guild)
+                else:
+                    banned_users, _ = self.ban_cache.peek_bans(guild.id)
+                    snapshot = BanSnapshot(
+                        banned_users,
+                        guild.id,
+                        guild.name,
+                        audit_index=self.audit_index,
+                        loading=True
+                    )
+                view.update_selection(snapshot.full_selection)
+                await message.edit(embed=view.build_embed(), view=view)
+        except (discord.NotFound, discord.HTTPException) as e:
+            logger.warning(f"Could not refresh streamed ban list: {e}")
+        except Exception as e:
+            logger.error(f"Error while streaming ban list: {e}")
+
     @ban_list.error
     async def ban_list_error(self, interaction: discord.Interaction, error):
         """Error handler for ban_list command"""
@@ -5,9 +5,8 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
-import json
-import os
 from datetime import datetime
+from utils.storage import get_storage
 
 logger = logging.getLogger(__name__)
 
@@ -16,24 +15,22 @@ class GuardianCommands(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.guardian_file = "guardian_data.json"
+        self.storage = get_storage()
         self.guardian_data = self.load_guardian_data()
 
     def load_guardian_data(self):
-        """Load guardian data from file"""
+        """Load guardian data from storage"""
         try:
-            if os.path.exists(self.guardian_file):
-                with open(self.guardian_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            return self.storage.load("guardian")
         except Exception as e:
             logger.error(f"Error loading guardian data: {e}")
         return {}
 
-    def save_guardian_data(self):
-        """Save guardian data to file"""
+    def save_guardian_data(self, guild_id):
+        """Save the guardian data of one guild"""
         try:
-            with open(self.guardian_file, 'w', encoding='utf-8') as f:
-                json.dump(self.guardian_data, f, indent=2, ensure_ascii=False)
+            guild_id = str(guild_id)
+            self.storage.put("guardian", guild_id, self.guardian_data[guild_id])
         except Exception as e:
             logger.error(f"Error saving guardian data: {e}")
 
@@ -145,7 +142,7 @@ class GuardianCommands(commands.Cog):
                 "reason": reason
             }
 
-            self.save_guardian_data()
+            self.save_guardian_data(interaction.guild.id)
 
             # Create success embed
             embed = discord.Embed(
@@ -208,7 +205,7 @@ class GuardianCommands(commands.Cog):
             # Remove protection
             guild_data = self.get_guild_data(interaction.guild.id)
             del guild_data["protected_users"][str(user.id)]
-            self.save_guardian_data()
+            self.save_guardian_data(interaction.guild.id)
 
             # Create success embed
             embed = discord.Embed(
@@ -298,7 +295,7 @@ class GuardianCommands(commands.Cog):
                     return
 
                 guild_data["exception_roles"].append(role.id)
-                self.save_guardian_data()
+                self.save_guardian_data(interaction.guild.id)
 
                 embed = discord.Embed(
                     title="✅ Rôle d'Exception Ajouté",
@@ -315,7 +312,7 @@ class GuardianCommands(commands.Cog):
                     return
 
                 guild_data["exception_roles"].remove(role.id)
-                self.save_guardian_data()
+                self.save_guardian_data(interaction.guild.id)
 
                 embed = discord.Embed(
                     title="✅ Rôle d'Exception Retiré",
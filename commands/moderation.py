@@ -7,8 +7,9 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
-from datetime import datetime, timedelta
-import asyncio
+from datetime import datetime, timedelta, timezone
+from utils.ban_record import BanRecord
+from utils.mute_renewal import MuteRenewalScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,29 @@ class ModerationCommands(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        # Renews mutes longer than 28 days (persisted, one task for every member)
+        self.mute_renewals = MuteRenewalScheduler(bot)
+
+    def cog_unload(self):
+        """Stop the mute renewal task"""
+        self.mute_renewals.stop()
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Reconcile the extended mutes with the actual timeouts, then start renewing"""
+        for guild in self.bot.guilds:
+            self.mute_renewals.reconcile(guild)
+        self.mute_renewals.start()
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        """Re-apply an extended mute to a member who left and came back"""
+        await self.mute_renewals.on_member_join(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        """Stop renewing a mute removed by a moderator"""
+        self.mute_renewals.on_member_update(before, after)
 
     def has_moderation_permission(self, member):
         """Check if user has moderation permissions"""
@@ -292,6 +316,7 @@ class ModerationCommands(commands.Cog):
             return
 
         # Handle permanent mute (28 days max per Discord API, but we'll cycle it)
+        requested_seconds = duration_seconds
         if is_permanent or duration_seconds > 28 * 24 * 60 * 60:
             duration_seconds = 28 * 24 * 60 * 60  # Max Discord allows
             is_extended_mute = True
@@ -309,6 +334,12 @@ class ModerationCommands(commands.Cog):
                 timeout_until,
                 reason=f"Timeout par {interaction.user} - {reason}"
             )
+            if is_extended_mute:
+                self.perform_extended_mute(
+                    user, f"Timeout par {interaction.user} - {reason}", timeout_until, requested_seconds
+                )
+            else:
+                self.mute_renewals.cancel(interaction.guild.id, user.id)
 
             # Create success embed
             embed = discord.Embed(
@@ -321,7 +352,13 @@ class ModerationCommands(commands.Cog):
             embed.add_field(name="Utilisateur", value=f"{user} (`{user.id}`)", inline=True)
             embed.add_field(name="Modérateur", value=interaction.user.mention, inline=True)
             embed.add_field(name="Durée", value=duration, inline=True)
-            embed.add_field(name="Fin du timeout", value=f"<t:{int(timeout_until.timestamp())}:F>", inline=True)
+            if is_extended_mute and is_permanent:
+                embed.add_field(name="Fin du timeout", value="♾️ Jamais (permanent)", inline=True)
+            elif is_extended_mute:
+                mute_end = timeout_until + timedelta(seconds=requested_seconds - duration_seconds)
+                embed.add_field(name="Fin du timeout", value=f"<t:{int(mute_end.timestamp())}:F>", inline=True)
+            else:
+                embed.add_field(name="Fin du timeout", value=f"<t:{int(timeout_until.timestamp())}:F>", inline=True)
             embed.add_field(name="Raison", value=reason, inline=False)
 
             embed.set_thumbnail(url=user.avatar.url if user.avatar else user.default_avatar.url)
@@ -444,14 +481,16 @@ class ModerationCommands(commands.Cog):
             # Convert user_id to int
             user_id = int(user_id)
 
-            # Get banned users to check if user is actually banned
-            banned_users = [ban_entry async for ban_entry in interaction.guild.bans()]
-            banned_user = None
-
-            for ban_entry in banned_users:
-                if ban_entry.user.id == user_id:
-                    banned_user = ban_entry.user
-                    break
+            # Check if user is actually banned (shared ban cache, or a single lookup)
+            if hasattr(self.bot, 'ban_cache'):
+                banned_user = await self.bot.ban_cache.get_ban(interaction.guild, user_id)
+            else:
+                try:
+                    banned_user = BanRecord.from_ban_entry(
+                        await interaction.guild.fetch_ban(discord.Object(id=user_id))
+                    )
+                except discord.NotFound:
+                    banned_user = None
 
             if not banned_user:
                 await interaction.followup.send(
@@ -465,6 +504,10 @@ class ModerationCommands(commands.Cog):
                 banned_user,
                 reason=f"Débanni par {interaction.user} - {reason}"
             )
+            if hasattr(self.bot, 'ban_cache'):
+                self.bot.ban_cache.remove(interaction.guild.id, banned_user.id)
+            if hasattr(self.bot, 'temp_ban_scheduler'):
+                self.bot.temp_ban_scheduler.cancel(interaction.guild.id, banned_user.id)
 
             # Create success embed
             embed = discord.Embed(
@@ -478,7 +521,7 @@ class ModerationCommands(commands.Cog):
             embed.add_field(name="Modérateur", value=interaction.user.mention, inline=True)
             embed.add_field(name="Raison", value=reason, inline=False)
 
-            embed.set_thumbnail(url=banned_user.avatar.url if banned_user.avatar else banned_user.default_avatar.url)
+            embed.set_thumbnail(url=banned_user.avatar_url)
             embed.set_footer(text="Créé par @Ninja Iyed")
 
             await interaction.followup.send(embed=embed)
@@ -539,6 +582,7 @@ class ModerationCommands(commands.Cog):
 
             # Remove timeout
             await user.timeout(None, reason=f"Timeout retiré par {interaction.user} - {reason}")
+            self.mute_renewals.cancel(interaction.guild.id, user.id)
 
             # Create success embed
             embed = discord.Embed(
@@ -945,6 +989,7 @@ class ModerationCommands(commands.Cog):
             return
 
         # Handle permanent mute (28 days max per Discord API, but we'll cycle it)
+        requested_seconds = duration_seconds
         if is_permanent or duration_seconds > 28 * 24 * 60 * 60:
             duration_seconds = 28 * 24 * 60 * 60  # Max Discord allows
             is_extended_mute = True
@@ -970,6 +1015,8 @@ class ModerationCommands(commands.Cog):
                 timeout_until,
                 reason=f"Auto-mute par {user} - {reason}"
             )
+            if is_extended_mute:
+                self.perform_extended_mute(user, f"Auto-mute par {user} - {reason}", timeout_until, requested_seconds)
 
             # Create success embed
             embed = discord.Embed(
@@ -981,7 +1028,13 @@ class ModerationCommands(commands.Cog):
 
             embed.add_field(name="Utilisateur", value=f"{user} (`{user.id}`)", inline=True)
             embed.add_field(name="Durée", value=duration, inline=True)
-            embed.add_field(name="Fin du timeout", value=f"<t:{int(timeout_until.timestamp())}:F>", inline=True)
+            if is_extended_mute and is_permanent:
+                embed.add_field(name="Fin du timeout", value="♾️ Jamais (permanent)", inline=True)
+            elif is_extended_mute:
+                mute_end = timeout_until + timedelta(seconds=requested_seconds - duration_seconds)
+                embed.add_field(name="Fin du timeout", value=f"<t:{int(mute_end.timestamp())}:F>", inline=True)
+            else:
+                embed.add_field(name="Fin du timeout", value=f"<t:{int(timeout_until.timestamp())}:F>", inline=True)
             embed.add_field(name="Raison", value=reason, inline=False)
 
             embed.set_thumbnail(url=user.avatar.url if user.avatar else user.default_avatar.url)
@@ -1147,19 +1200,13 @@ class ModerationCommands(commands.Cog):
         except (ValueError, IndexError):
             return None
 
-    async def perform_extended_mute(self, user: discord.Member, reason: str):
-        """Cycles timeout every 28 days to simulate permanent mute."""
-        while True:
-            try:
-                timeout_until = datetime.utcnow() + timedelta(days=28)
-                await user.timeout(timeout_until, reason=reason)
-                await asyncio.sleep(24 * 60 * 60 * 27)  # Re-apply every 27 days to be safe
-            except discord.Forbidden:
-                logger.warning(f"No permission to extend mute for {user.name}")
-                break
-            except Exception as e:
-                logger.error(f"Error extending mute for {user.name}: {e}")
-                break
+    def perform_extended_mute(self, user: discord.Member, reason: str, timeout_until: datetime, requested_seconds: float):
+        """Register a mute longer than 28 days so the renewal scheduler keeps re-applying it."""
+        applied_until = timeout_until.replace(tzinfo=timezone.utc)
+        until = None
+        if requested_seconds != float('inf'):
+            until = applied_until + timedelta(seconds=requested_seconds - 28 * 24 * 60 * 60)
+        self.mute_renewals.register(user, applied_until, reason, until=until)
 
     async def diagnostic(self, interaction: discord.Interaction):
         """Run diagnostics to check bot and server settings."""
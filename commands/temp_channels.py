@@ -8,77 +8,197 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
-import json
-import os
 import asyncio
+import heapq
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from utils.storage import get_storage
 
 logger = logging.getLogger(__name__)
 
 class TempChannelsCommands(commands.Cog):
     """Cog pour les commandes de salons temporaires"""
 
+    # Nombre maximum de salons avertis/supprimés en même temps
+    MAX_CONCURRENT_EXPIRIES = 10
+    # Délai entre l'avertissement et la suppression (secondes)
+    DELETE_WARNING_DELAY = 30
+
     def __init__(self, bot):
         self.bot = bot
-        self.temp_channels_file = "temp_channels.json"
+        self.storage = get_storage()
         self.temp_channels = self.load_temp_channels()
+        self._wakeup = asyncio.Event()
+        self._expiry_slots = asyncio.Semaphore(self.MAX_CONCURRENT_EXPIRIES)
+        self._expiring = set()  # Salons en cours d'avertissement/suppression
+        self._expiry_tasks = set()  # Références fortes: la boucle ne garde que des références faibles
+        # Échéances pré-calculées: channel_id -> timestamp, et tas (timestamp, channel_id)
+        self.deadlines = {}
+        self._deadline_heap = []
+        for channel_id, data in self.temp_channels.items():
+            self.schedule_expiry(int(channel_id), datetime.fromisoformat(data['expires_at']))
         self.cleanup_task = None
         self.start_cleanup_task()
 
     def load_temp_channels(self):
         """Charger les données des salons temporaires"""
         try:
-            if os.path.exists(self.temp_channels_file):
-                with open(self.temp_channels_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            return self.storage.load("temp_channels")
         except Exception as e:
             logger.error(f"Error loading temp channels data: {e}")
         return {}
 
-    def save_temp_channels(self):
-        """Sauvegarder les données des salons temporaires"""
+    def save_temp_channels(self, *channel_ids):
+        """Sauvegarder (ou effacer) la ligne de chaque salon donné"""
         try:
-            with open(self.temp_channels_file, 'w', encoding='utf-8') as f:
-                json.dump(self.temp_channels, f, indent=2, ensure_ascii=False)
+            with self.storage.transaction():
+                for channel_id in map(str, channel_ids):
+                    if channel_id in self.temp_channels:
+                        self.storage.put("temp_channels", channel_id, self.temp_channels[channel_id])
+                    else:
+                        self.storage.delete("temp_channels", channel_id)
         except Exception as e:
             logger.error(f"Error saving temp channels data: {e}")
 
+    def schedule_expiry(self, channel_id: int, expire_time: datetime):
+        """Enregistrer (ou déplacer) l'échéance d'un salon temporaire"""
+        deadline = expire_time.timestamp()
+        self.deadlines[channel_id] = deadline
+        heapq.heappush(self._deadline_heap, (deadline, channel_id))
+        # Réveiller le planificateur si cette échéance est plus proche
+        self._wakeup.set()
+
+    def unschedule_expiry(self, channel_id: int):
+        """Oublier l'échéance d'un salon (l'entrée du tas est ignorée plus tard)"""
+        self.deadlines.pop(channel_id, None)
+
     def start_cleanup_task(self):
         """Démarrer la tâche de nettoyage automatique"""
         if self.cleanup_task is None or self.cleanup_task.done():
             self.cleanup_task = asyncio.create_task(self.cleanup_expired_channels())
 
+    def _next_deadline_delay(self):
+        """Secondes avant la prochaine échéance valide, ou None s'il n'y en a pas"""
+        while self._deadline_heap:
+            deadline, channel_id = self._deadline_heap[0]
+            if self.deadlines.get(channel_id) == deadline:
+                return deadline - datetime.now().timestamp()
+            heapq.heappop(self._deadline_heap)  # Salon prolongé ou supprimé
+        return None
+
+    def _pop_due_channels(self):
+        """Retirer du tas tous les salons arrivés à échéance"""
+        now = datetime.now().timestamp()
+        due = []
+        while self._deadline_heap and self._deadline_heap[0][0] <= now:
+            deadline, channel_id = heapq.heappop(self._deadline_heap)
+            if self.deadlines.get(channel_id) == deadline:
+                del self.deadlines[channel_id]
+                due.append(channel_id)
+        return due
+
+    def reconcile_temp_channels(self):
+        """
+        Comparer les salons enregistrés aux caches des serveurs après un redémarrage
+
+        Un seul passage sur les caches, sans appel REST: les salons disparus
+        pendant l'arrêt sont oubliés, ceux expirés entre-temps sont supprimés
+        immédiatement (sans le délai d'avertissement).
+        """
+        now = datetime.now().timestamp()
+        orphans = []
+        lapsed = []
+
+        for channel_id, data in self.temp_channels.items():
+            guild = self.bot.get_guild(data.get('guild_id', 0))
+            if guild is not None and guild.unavailable:
+                continue  # Panne Discord: on vérifiera plus tard
+            channel = guild.get_channel(int(channel_id)) if guild else self.bot.get_channel(int(channel_id))
+            if channel is None:
+                orphans.append(channel_id)
+            elif self.deadlines.get(int(channel_id), 0) <= now:
+                lapsed.append(int(channel_id))
+
+        for channel_id in orphans:
+            del self.temp_channels[channel_id]
+            self.unschedule_expiry(int(channel_id))
+        if orphans:
+            self.save_temp_channels(*orphans)
+
+        for channel_id in lapsed:
+            self.unschedule_expiry(channel_id)
+            self._expiring.add(channel_id)
+            self._spawn_expiry(channel_id, warn=False)
+
+        logger.info(
+            f"Temp channels reconciled: {len(self.temp_channels)} tracked, "
+            f"{len(orphans)} orphan(s) dropped, {len(lapsed)} expired while offline"
+        )
+
     async def cleanup_expired_channels(self):
-        """Tâche de nettoyage des salons expirés"""
+        """Tâche de nettoyage: dort exactement jusqu'à la prochaine échéance"""
+        # Les caches des salons doivent être remplis avant de comparer quoi que ce soit
+        await self.bot.wait_until_ready()
+        self.reconcile_temp_channels()
+
         while True:
             try:
-                await asyncio.sleep(60)  # Vérifier toutes les minutes
-                current_time = datetime.now()
-                expired_channels = []
-
-                for channel_id, data in self.temp_channels.items():
-                    expire_time = datetime.fromisoformat(data['expires_at'])
-                    if current_time >= expire_time:
-                        expired_channels.append(channel_id)
-
-                for channel_id in expired_channels:
-                    await self.delete_temp_channel(int(channel_id))
-
+                self._wakeup.clear()
+                delay = self._next_deadline_delay()
+                if delay is None:
+                    await self._wakeup.wait()
+                    continue
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                        continue  # Nouvelle échéance: recalculer le délai
+                    except asyncio.TimeoutError:
+                        pass
+
+                # Chaque salon expire dans sa propre tâche, le sémaphore borne la concurrence
+                for channel_id in self._pop_due_channels():
+                    if channel_id not in self._expiring:
+                        self._expiring.add(channel_id)
+                        self._spawn_expiry(channel_id)
+
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in cleanup task: {e}")
-                await asyncio.sleep(300)  # Attendre 5 minutes avant de reprendre
+                await asyncio.sleep(5)
+
+    def _spawn_expiry(self, channel_id: int, warn: bool = True):
+        """Lancer l'expiration d'un salon dans une tâche suivie jusqu'à sa fin"""
+        task = asyncio.create_task(self._expire_channel(channel_id, warn=warn))
+        self._expiry_tasks.add(task)
+        task.add_done_callback(self._expiry_tasks.discard)
 
-    async def delete_temp_channel(self, channel_id: int):
+    async def _expire_channel(self, channel_id: int, warn: bool = True):
+        """Avertir puis supprimer un salon expiré, dans la limite de concurrence"""
+        try:
+            async with self._expiry_slots:
+                await self.delete_temp_channel(channel_id, warn=warn)
+        finally:
+            self._expiring.discard(channel_id)
+
+    async def delete_temp_channel(self, channel_id: int, warn: bool = True):
         """Supprimer un salon temporaire"""
         try:
             channel = self.bot.get_channel(channel_id)
-            if channel:
+            if channel and not warn:
+                try:
+                    await channel.delete(reason="Salon temporaire expiré pendant l'arrêt du bot")
+                    logger.info(f"Deleted temp channel expired while offline: {channel.name}")
+                except discord.NotFound:
+                    pass
+                except Exception as e:
+                    logger.error(f"Error deleting temp channel {channel_id}: {e}")
+            elif channel:
                 # Envoyer un message d'avertissement avant suppression
                 try:
                     embed = discord.Embed(
                         title="⏰ Salon Temporaire Expiré",
-                        description="Ce salon temporaire va être supprimé dans 30 secondes.",
+                        description=f"Ce salon temporaire va être supprimé dans {self.DELETE_WARNING_DELAY} secondes.",
                         color=discord.Color.orange(),
                         timestamp=datetime.utcnow()
                     )
@@ -87,8 +207,12 @@ class TempChannelsCommands(commands.Cog):
                     if isinstance(channel, discord.TextChannel):
                         await channel.send(embed=embed)
                     
-                    # Attendre 30 secondes
-                    await asyncio.sleep(30)
+                    # Attendre avant la suppression
+                    await asyncio.sleep(self.DELETE_WARNING_DELAY)
+                    
+                    # Le salon a pu être prolongé pendant l'avertissement
+                    if channel_id in self.deadlines:
+                        return
                     
                     # Supprimer le salon
                     await channel.delete(reason="Salon temporaire expiré")
@@ -100,9 +224,10 @@ class TempChannelsCommands(commands.Cog):
                     logger.error(f"Error deleting temp channel {channel_id}: {e}")
 
             # Retirer de la liste des salons temporaires
+            self.unschedule_expiry(channel_id)
             if str(channel_id) in self.temp_channels:
                 del self.temp_channels[str(channel_id)]
-                self.save_temp_channels()
+                self.save_temp_channels(channel_id)
 
         except Exception as e:
             logger.error(f"Error in delete_temp_channel: {e}")
@@ -225,7 +350,8 @@ class TempChannelsCommands(commands.Cog):
                 'guild_id': interaction.guild.id,
                 'reason': reason
             }
-            self.save_temp_channels()
+            self.save_temp_channels(channel.id)
+            self.schedule_expiry(channel.id, expire_time)
 
             # Créer l'embed de confirmation
             embed = discord.Embed(
@@ -356,7 +482,8 @@ class TempChannelsCommands(commands.Cog):
                 'user_limit': user_limit,
                 'reason': reason
             }
-            self.save_temp_channels()
+            self.save_temp_channels(channel.id)
+            self.schedule_expiry(channel.id, expire_time)
 
             # Créer l'embed de confirmation
             embed = discord.Embed(
@@ -507,7 +634,8 @@ class TempChannelsCommands(commands.Cog):
                 return
 
             self.temp_channels[str(channel.id)]['expires_at'] = new_expire.isoformat()
-            self.save_temp_channels()
+            self.save_temp_channels(channel.id)
+            self.schedule_expiry(channel.id, new_expire)
 
             # Créer l'embed de confirmation
             embed = discord.Embed(
@@ -570,7 +698,8 @@ class TempChannelsCommands(commands.Cog):
 
             # Retirer de la liste
             del self.temp_channels[str(channel.id)]
-            self.save_temp_channels()
+            self.save_temp_channels(channel.id)
+            self.unschedule_expiry(channel.id)
 
             # Créer l'embed de confirmation
             embed = discord.Embed(
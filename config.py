@@ -63,6 +63,34 @@ FEATURES = {
     "fake_moderation": True,
 }
 
+# Bot signatures detected in ban reasons when the audit log is unavailable
+# Lowercase text fragment -> bot name, checked in this order (add your own automod bots here)
+BOT_SIGNATURES = {
+    "dyno": "Dyno",
+    "carl-bot": "Carl-bot",
+    "carl bot": "Carl-bot",
+    "mee6": "MEE6",
+    "ticket tool": "Ticket Tool",
+    "modmail": "ModMail",
+    "automod": "AutoMod",
+    "auto-mod": "AutoMod",
+    "security": "Security Bot",
+    "raid": "Anti-Raid Bot",
+    "anti-raid": "Anti-Raid Bot",
+    "pancake": "Pancake",
+    "groovy": "Groovy",
+    "rythm": "Rythm",
+    "fredboat": "FredBoat",
+    "pokecord": "Pokecord",
+    "mudae": "Mudae",
+    "dank memer": "Dank Memer",
+    "tatsu": "Tatsu",
+    "arcane": "Arcane",
+    "epic rpg": "Epic RPG",
+    "idle miner": "Idle Miner",
+    "reaction": "Reaction Role Bot",
+}
+
 # Version info
 VERSION_INFO = {
     "major": 2,
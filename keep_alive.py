@@ -11,6 +11,7 @@ import platform
 from datetime import datetime
 import os
 import discord
+from utils.storage import get_storage
 
 logger = logging.getLogger(__name__)
 
@@ -353,9 +354,29 @@ def metrics():
             "percent": psutil.cpu_percent(interval=1),
             "count": psutil.cpu_count()
         },
+        "fetches": get_fetch_stats(),
+        "deletions": get_deletion_stats(),
+        "storage": get_storage().get_stats(),
         "timestamp": datetime.now().isoformat()
     })
 
+def get_fetch_stats():
+    """Hit/miss/coalesced counters of the shared ban and audit log fetches"""
+    stats = {}
+    if bot_instance:
+        ban_cache = getattr(bot_instance, 'ban_cache', None)
+        if ban_cache:
+            stats["bans"] = ban_cache.fetches.get_stats()
+        audit_index = getattr(bot_instance, 'ban_audit_index', None)
+        if audit_index:
+            stats["audit_logs"] = audit_index.fetches.get_stats()
+    return stats
+
+def get_deletion_stats():
+    """Counters and pending count of the delayed message deletion queue"""
+    deletion_queue = getattr(bot_instance, 'deletion_queue', None) if bot_instance else None
+    return deletion_queue.get_metrics() if deletion_queue else {}
+
 
 PANEL_TEMPLATE = """
 <!DOCTYPE html>
@@ -34,7 +34,9 @@ async def main():
         keep_alive.bot_instance = bot
         
         logger.info("Starting Discord bot...")
-        await bot.start(bot_token)
+        # Leaving the context closes the bot, which unloads the cogs and flushes pending writes
+        async with bot:
+            await bot.start(bot_token)
         
     except Exception as e:
         logger.error(f"Error starting bot: {e}")
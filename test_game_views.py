@@ -0,0 +1,61 @@
+"""
+Test des vues du quiz construites à partir de la vraie banque de questions
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from utils.quiz_bank import QuizBank
+from utils.game_views import QuizView, QuizRoundView
+
+def make_cog():
+    """Cog minimal: la banque de questions et les compteurs appelés par les vues"""
+    calls = []
+    return SimpleNamespace(
+        quiz_bank=QuizBank.load(),
+        active_games={},
+        record_quiz_results=lambda index, results: calls.append((index, results)),
+        add_score=lambda *args: None,
+        calls=calls
+    )
+
+def test_quiz_view_buttons():
+    """Un bouton par option de la question, pour chaque question de la banque"""
+    async def build():
+        cog = make_cog()
+        assert len(cog.quiz_bank) > 0
+        for index, question in enumerate(cog.quiz_bank.questions):
+            view = QuizView(cog, 1, 2, index)
+            assert view.question is question
+            assert [button.label for button in view.buttons.values()] == [option[:80] for option in question["options"]]
+    asyncio.run(build())
+
+def test_quiz_round_view_buttons():
+    """La manche du salon affiche les mêmes options et démarre sans réponse"""
+    async def build():
+        cog = make_cog()
+        for index, question in enumerate(cog.quiz_bank.questions):
+            view = QuizRoundView(cog, 2, index, duration=30)
+            assert view.question is question
+            assert list(view.buttons) == QuizView.LETTERS[:len(question["options"])]
+            assert view.answers == {}
+    asyncio.run(build())
+
+def test_quiz_round_tally():
+    """Décompte par option et gagnants dans l'ordre des réponses"""
+    async def build():
+        cog = make_cog()
+        view = QuizRoundView(cog, 2, 0, duration=30)
+        correct = view.question["correct"]
+        wrong = next(letter for letter in view.buttons if letter != correct)
+        view.answers = {10: correct, 11: wrong, 12: correct}
+        counts, winners = view.tally()
+        assert counts[correct] == 2 and counts[wrong] == 1
+        assert winners == [10, 12]
+    asyncio.run(build())
+
+if __name__ == "__main__":
+    test_quiz_view_buttons()
+    test_quiz_round_view_buttons()
+    test_quiz_round_tally()
+    print("✅ Vues du quiz OK")
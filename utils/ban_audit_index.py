@@ -0,0 +1,200 @@
+"""
+Ban Audit Index
+Persistent per-guild index of ban audit log entries used to attribute bans
+"""
+
+import discord
+import asyncio
+import logging
+from utils.storage import get_storage
+from utils.ban_record import BanAuditRecord
+from utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+class BanAuditIndex:
+    """Persisted index of ban audit entries (target -> moderator, date, reason)"""
+
+    # Entries fetched on the first run before the backfill takes over
+    INITIAL_FETCH_LIMIT = 100
+    # Save progress every N entries while backfilling older history
+    BACKFILL_SAVE_EVERY = 500
+    # Seconds during which a finished refresh is reused by the next callers
+    REFRESH_TTL = 10
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.storage = get_storage()
+        self.index_data = self.load_index()
+        # Rows changed since the last save: guild IDs and (guild ID, target ID)
+        self._dirty_guilds = set()
+        self._dirty_entries = set()
+        self._backfill_tasks = {}
+        # One audit log scan per guild at a time, shared by concurrent /banlist calls
+        self.fetches = SingleFlight(ttl=self.REFRESH_TTL)
+        self.reason_index = None  # Optional BanReasonIndex fed with audit reasons
+        self.version = 0  # Bumped on every change, used to expire rendered pages
+
+    def load_index(self):
+        """Load the cursors of each guild, and its entries as BanAuditRecord objects"""
+        index_data = {}
+        # The only copy of the entries, as consumed by create_ban_list_embed
+        self._ban_info = {}
+        try:
+            index_data = self.storage.load("ban_audit_guilds")
+            for key, data in self.storage.load("ban_audit_entries").items():
+                guild_id, target_id = key.split(":")
+                if guild_id in index_data:
+                    self._ban_info.setdefault(int(guild_id), {})[int(target_id)] = BanAuditRecord.from_row(data)
+        except Exception as e:
+            logger.error(f"Error loading ban audit index: {e}")
+        return index_data
+
+    def save_index(self):
+        """Write the cursors and entries changed since the last save (one row each)"""
+        try:
+            with self.storage.transaction():
+                for guild_id in self._dirty_guilds:
+                    self.storage.put("ban_audit_guilds", guild_id, self.index_data[guild_id])
+                for guild_id, target_id in self._dirty_entries:
+                    self.storage.put(
+                        "ban_audit_entries",
+                        f"{guild_id}:{target_id}",
+                        self._ban_info[int(guild_id)][int(target_id)].to_row()
+                    )
+            self._dirty_guilds.clear()
+            self._dirty_entries.clear()
+        except Exception as e:
+            logger.error(f"Error saving ban audit index: {e}")
+
+    def get_guild_data(self, guild_id):
+        """Get the index data of a guild"""
+        guild_id = str(guild_id)
+        if guild_id not in self.index_data:
+            self.index_data[guild_id] = {
+                "cursor": None,            # Newest audit entry ID seen
+                "backfill_before": None,   # Oldest audit entry ID seen
+                "backfill_done": False
+            }
+        return self.index_data[guild_id]
+
+    def get_ban_info(self, guild_id):
+        """Return {user_id: BanAuditRecord}"""
+        return self._ban_info.get(guild_id, {})
+
+    def record_entry(self, guild_id, entry):
+        """Store a ban audit entry, keeping the most recent ban of each target"""
+        if not entry.target or not entry.target.id:
+            return False
+
+        self.get_guild_data(guild_id)
+        guild_entries = self._ban_info.setdefault(guild_id, {})
+
+        existing = guild_entries.get(entry.target.id)
+        if existing and existing.entry_id >= entry.id:
+            return False
+
+        moderator = entry.user
+        guild_entries[entry.target.id] = BanAuditRecord(
+            entry.id,
+            moderator.id if moderator else entry.user_id,
+            getattr(moderator, 'display_name', None) or "Inconnu",
+            getattr(moderator, 'bot', False),
+            entry.created_at,
+            entry.reason
+        )
+        self._dirty_guilds.add(str(guild_id))
+        self._dirty_entries.add((str(guild_id), str(entry.target.id)))
+        self.version += 1
+        if self.reason_index:
+            self.reason_index.set_audit_reason(guild_id, entry.target.id, entry.reason)
+        return True
+
+    def _advance_cursors(self, guild_id, entry_id):
+        """Track the newest and oldest audit entry IDs seen"""
+        guild_data = self.get_guild_data(guild_id)
+        self._dirty_guilds.add(str(guild_id))
+        if guild_data["cursor"] is None or entry_id > guild_data["cursor"]:
+            guild_data["cursor"] = entry_id
+        if guild_data["backfill_before"] is None or entry_id < guild_data["backfill_before"]:
+            guild_data["backfill_before"] = entry_id
+
+    async def refresh(self, guild):
+        """Fetch the new ban audit entries, sharing the scan between concurrent callers"""
+        await self.fetches.run(guild.id, lambda: self._refresh(guild))
+
+    async def _refresh(self, guild):
+        """Fetch only the ban audit entries newer than the saved cursor"""
+        guild_data = self.get_guild_data(guild.id)
+        previous_cursor = guild_data["cursor"]
+        changed = False
+
+        if guild_data["cursor"] is None:
+            # First run: newest entries only, older history is backfilled later
+            iterator = guild.audit_logs(action=discord.AuditLogAction.ban, limit=self.INITIAL_FETCH_LIMIT)
+        else:
+            iterator = guild.audit_logs(
+                action=discord.AuditLogAction.ban,
+                limit=None,
+                after=discord.Object(id=guild_data["cursor"])
+            )
+
+        async for entry in iterator:
+            changed = self.record_entry(guild.id, entry) or changed
+            self._advance_cursors(guild.id, entry.id)
+
+        if changed or guild_data["cursor"] != previous_cursor:
+            self.save_index()
+
+        self.start_backfill(guild)
+
+    def start_backfill(self, guild):
+        """Backfill older ban history once, in the background"""
+        guild_data = self.get_guild_data(guild.id)
+        if guild_data["backfill_done"] or guild_data["backfill_before"] is None:
+            return
+
+        task = self._backfill_tasks.get(guild.id)
+        if task is None or task.done():
+            self._backfill_tasks[guild.id] = asyncio.create_task(self._backfill(guild))
+
+    async def _backfill(self, guild):
+        """Walk the audit log backwards from the oldest entry seen"""
+        guild_data = self.get_guild_data(guild.id)
+        count = 0
+        try:
+            async for entry in guild.audit_logs(
+                action=discord.AuditLogAction.ban,
+                limit=None,
+                before=discord.Object(id=guild_data["backfill_before"])
+            ):
+                self.record_entry(guild.id, entry)
+                self._advance_cursors(guild.id, entry.id)
+                count += 1
+                if count % self.BACKFILL_SAVE_EVERY == 0:
+                    self.save_index()
+
+            guild_data["backfill_done"] = True
+            self._dirty_guilds.add(str(guild.id))
+            self.save_index()
+            logger.info(f"Ban audit backfill finished for guild {guild.id}: {count} older entries")
+        except discord.Forbidden:
+            logger.warning(f"No audit log access to backfill bans for guild {guild.id}")
+        except Exception as e:
+            logger.error(f"Error backfilling ban audit log for guild {guild.id}: {e}")
+            self.save_index()
+
+    def on_audit_log_entry_create(self, entry):
+        """Index ban entries pushed by the gateway without any REST call"""
+        if entry.action != discord.AuditLogAction.ban:
+            return
+
+        guild_data = self.get_guild_data(entry.guild.id)
+        # Without a cursor the next refresh does the initial fetch anyway
+        if guild_data["cursor"] is None:
+            return
+
+        # Record only: the cursor stays where the last REST scan stopped, so bans
+        # made while the bot was offline are still fetched by the next refresh
+        if self.record_entry(entry.guild.id, entry):
+            self.save_index()
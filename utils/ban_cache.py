@@ -0,0 +1,284 @@
+"""
+Ban Cache
+Per-guild in-memory ban store, loaded once and kept current by gateway events
+"""
+
+import discord
+import asyncio
+import logging
+from utils.ban_search import BanSearchIndex
+from utils.ban_snapshot import BanSnapshot
+from utils.ban_record import BanRecord
+from utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+class BanCache:
+    """In-memory ban list for each guild, synchronized with ban/unban events"""
+
+    # Number of fetched bans between two progress notifications
+    PROGRESS_CHUNK = 100
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._bans = {}      # guild_id -> {user_id: BanRecord}
+        self._pending = {}   # guild_id -> events received while the fetch runs
+        self._search = {}    # guild_id -> BanSearchIndex
+        self._partial = {}   # guild_id -> bans fetched so far by a running fetch
+        self._progress = {}  # guild_id -> asyncio.Condition notified as pages arrive
+        self._snapshots = {} # guild_id -> published BanSnapshot of the current version
+        self._versions = {}  # guild_id -> version number, bumped on every ban/unban
+        self.reason_index = None  # Optional BanReasonIndex kept in sync with the bans
+        # Ban reasons from audit entries received before their ban event: (guild_id, user_id) -> reason
+        self._early_reasons = {}
+        # Concurrent first loads of a guild share one guild.bans() walk; once loaded,
+        # the list is kept current by gateway events, so no TTL is needed
+        self.fetches = SingleFlight()
+
+    def is_loaded(self, guild_id):
+        """Check if the ban list of a guild is already in memory"""
+        return guild_id in self._bans
+
+    async def ensure_loaded(self, guild):
+        """Load the ban list of a guild once, sharing the fetch between callers"""
+        if guild.id in self._bans:
+            self.fetches.record_hit()
+            return
+
+        await self.fetches.run(guild.id, lambda: self._start_load(guild))
+
+    def _start_load(self, guild):
+        """Prepare the state of a new fetch and return its coroutine"""
+        self._pending[guild.id] = []
+        self._partial[guild.id] = {}
+        self._progress[guild.id] = asyncio.Condition()
+        return self._load(guild)
+
+    async def _load(self, guild):
+        """Fetch every ban of a guild from the API"""
+        bans = self._partial[guild.id]
+        progress = self._progress[guild.id]
+        try:
+            search_index = BanSearchIndex()
+            chunk = []
+            async for ban_entry in guild.bans(limit=None):
+                # Keep a compact record, not the BanEntry/User object graph
+                record = BanRecord.from_ban_entry(ban_entry)
+                bans[record.id] = record
+                chunk.append(record)
+
+                # Index and wake up streaming readers one chunk at a time
+                if len(chunk) >= self.PROGRESS_CHUNK:
+                    search_index.add_many(chunk, sort=False)
+                    chunk = []
+                    async with progress:
+                        progress.notify_all()
+            search_index.add_many(chunk)
+
+            # Replay the events received during the fetch so they win over stale pages
+            for action, payload in self._pending.get(guild.id, []):
+                if action == "ban":
+                    bans[payload.id] = payload
+                    search_index.add(payload)
+                elif action == "reason":
+                    user_id, reason = payload
+                    if user_id in bans:
+                        bans[user_id] = bans[user_id].with_reason(reason)
+                    else:
+                        self._early_reasons[(guild.id, user_id)] = reason
+                else:
+                    bans.pop(payload, None)
+                    search_index.remove(payload)
+
+            self._bans[guild.id] = bans
+            self._search[guild.id] = search_index
+            # From here on, live events update the cache and the reason index directly
+            self._pending.pop(guild.id, None)
+
+            if self.reason_index:
+                # Queued before any live event write (no await in between), so the
+                # writer thread applies those events on top of the synced state
+                audit_index = getattr(self.bot, 'ban_audit_index', None)
+                ban_info = audit_index.get_ban_info(guild.id) if audit_index else {}
+                self.reason_index.sync_guild(
+                    guild.id,
+                    {user_id: record.reason for user_id, record in bans.items()},
+                    {user_id: info.reason for user_id, info in ban_info.items() if user_id in bans}
+                )
+            logger.info(f"Ban cache loaded for guild {guild.id}: {len(bans)} bans")
+        finally:
+            self._pending.pop(guild.id, None)
+            self._partial.pop(guild.id, None)
+            async with progress:
+                progress.notify_all()
+            self._progress.pop(guild.id, None)
+
+    async def get_first_bans(self, guild, count):
+        """
+        Return at least `count` ban records as soon as they are fetched
+
+        Returns:
+            tuple: (list of ban records, True if the list is complete)
+        """
+        if guild.id in self._bans:
+            self.fetches.record_hit()
+            return list(self._bans[guild.id].values()), True
+
+        task = self.fetches.get_task(guild.id, lambda: self._start_load(guild))
+        progress = self._progress[guild.id]
+        async with progress:
+            await progress.wait_for(
+                lambda: guild.id not in self._partial or len(self._partial[guild.id]) >= count
+            )
+
+        if guild.id in self._partial:
+            return list(self._partial[guild.id].values()), False
+
+        # The fetch is over: return the full list, or surface its exception
+        await asyncio.shield(task)
+        return list(self._bans[guild.id].values()), True
+
+    def peek_bans(self, guild_id):
+        """
+        Return the bans known so far without waiting for a running fetch
+
+        Returns:
+            tuple: (list of ban records, True if the list is complete)
+        """
+        if guild_id in self._bans:
+            return list(self._bans[guild_id].values()), True
+        return list(self._partial.get(guild_id, {}).values()), False
+
+    async def get_bans(self, guild):
+        """Return the ban records of a guild, loading them on first use"""
+        await self.ensure_loaded(guild)
+        return list(self._bans[guild.id].values())
+
+    async def get_snapshot(self, guild):
+        """
+        Return the current snapshot of a guild's ban list
+
+        Snapshots are immutable: a ban or unban publishes a new version on the
+        next call, while open views keep reading the version they started with.
+        """
+        await self.ensure_loaded(guild)
+        snapshot = self._snapshots.get(guild.id)
+        if snapshot is None:
+            snapshot = BanSnapshot(
+                self._bans[guild.id].values(),
+                guild.id,
+                guild.name,
+                version=self._versions.get(guild.id, 0),
+                audit_index=getattr(self.bot, 'ban_audit_index', None)
+            )
+            self._snapshots[guild.id] = snapshot
+        return snapshot
+
+    def _publish(self, guild_id):
+        """Retire the current snapshot so the next reader gets a new version"""
+        self._versions[guild_id] = self._versions.get(guild_id, 0) + 1
+        self._snapshots.pop(guild_id, None)
+
+    async def get_ban(self, guild, user_id):
+        """
+        Return the ban record of a user, or None if the user is not banned
+
+        Until the guild's list is loaded, a single ban lookup answers instead of
+        waiting for the whole guild.bans() walk.
+        """
+        if not self.is_loaded(guild.id):
+            try:
+                return BanRecord.from_ban_entry(await guild.fetch_ban(discord.Object(id=user_id)))
+            except discord.NotFound:
+                return None
+        return self._bans[guild.id].get(user_id)
+
+    def find_user_ids(self, guild_id, name="", reason=""):
+        """
+        Return the IDs of the loaded bans matching a name and/or reason query
+
+        Name matches are ranked by the search index, reason matches by the
+        full-text index; with both queries the name ranking is kept.
+        """
+        user_ids = None
+        if name and name.strip():
+            user_ids = self._search[guild_id].search(name)
+
+        if reason and reason.strip():
+            reason_ids = self.reason_index.search(guild_id, reason) if self.reason_index else []
+            if user_ids is None:
+                user_ids = reason_ids
+            else:
+                matched_ids = set(reason_ids)
+                user_ids = [user_id for user_id in user_ids if user_id in matched_ids]
+
+        return user_ids or []
+
+    def get_cached_ban(self, guild_id, user_id):
+        """Return a ban record without loading anything (None if unknown)"""
+        return self._bans.get(guild_id, {}).get(user_id)
+
+    def add(self, guild_id, record):
+        """Record a new ban for a guild"""
+        if guild_id in self._pending:
+            self._pending[guild_id].append(("ban", record))
+        elif guild_id in self._bans:
+            self._bans[guild_id][record.id] = record
+            self._search[guild_id].add(record)
+            # Views keep the snapshot they were opened with, new ones get the next version
+            self._publish(guild_id)
+            if self.reason_index:
+                self.reason_index.set_ban_reason(guild_id, record.id, record.reason)
+
+    def set_reason(self, guild_id, user_id, reason):
+        """Fill in the reason of a ban from its audit log entry"""
+        if guild_id in self._pending:
+            self._pending[guild_id].append(("reason", (user_id, reason)))
+            return
+        if guild_id not in self._bans:
+            return
+
+        record = self._bans[guild_id].get(user_id)
+        if record is None:
+            # The audit entry came first: the ban event picks the reason up
+            self._early_reasons[(guild_id, user_id)] = reason
+            return
+        if record.reason == reason:
+            return
+        # Records are shared with published snapshots: replace, never mutate
+        self._bans[guild_id][user_id] = record.with_reason(reason)
+        self._publish(guild_id)
+        if self.reason_index:
+            self.reason_index.set_ban_reason(guild_id, user_id, reason)
+
+    def remove(self, guild_id, user_id):
+        """Forget a ban after the user has been unbanned"""
+        self._early_reasons.pop((guild_id, user_id), None)
+        if guild_id in self._pending:
+            self._pending[guild_id].append(("unban", user_id))
+        elif guild_id in self._bans:
+            self._bans[guild_id].pop(user_id, None)
+            self._search[guild_id].remove(user_id)
+            self._publish(guild_id)
+            if self.reason_index:
+                self.reason_index.remove(guild_id, user_id)
+
+    def invalidate(self, guild_id):
+        """Drop the cached ban list of a guild"""
+        self._bans.pop(guild_id, None)
+        self._search.pop(guild_id, None)
+        self._publish(guild_id)
+
+    async def on_member_ban(self, guild, user):
+        """Keep the cache current when a member is banned"""
+        if not self.is_loaded(guild.id) and guild.id not in self._pending:
+            return
+
+        # No REST call per ban: the reason comes from the ban's audit log entry,
+        # now if it was received first, otherwise through set_reason
+        reason = self._early_reasons.pop((guild.id, user.id), None)
+        self.add(guild.id, BanRecord.from_user(user, reason))
+
+    def on_member_unban(self, guild, user):
+        """Keep the cache current when a member is unbanned"""
+        self.remove(guild.id, user.id)
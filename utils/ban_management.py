@@ -5,9 +5,9 @@ Handles unban, temporary ban, and permanent ban operations
 
 import discord
 from discord.ext import commands
-import asyncio
 from datetime import datetime, timedelta
 import logging
+from utils.temp_ban_scheduler import format_expiry_reason
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +29,15 @@ class BanManagementView(discord.ui.View):
         
         try:
             await interaction.response.defer()
-            await self.guild.unban(self.banned_user.user, reason=f"Débanni par {interaction.user}")
+            await self.guild.unban(self.banned_user, reason=f"Débanni par {interaction.user}")
+            if hasattr(interaction.client, 'ban_cache'):
+                interaction.client.ban_cache.remove(self.guild.id, self.banned_user.id)
+            if hasattr(interaction.client, 'temp_ban_scheduler'):
+                interaction.client.temp_ban_scheduler.cancel(self.guild.id, self.banned_user.id)
             
             embed = discord.Embed(
                 title="✅ Utilisateur Débanni",
-                description=f"**{self.banned_user.user.display_name}** a été débanni avec succès.",
+                description=f"**{self.banned_user.display_name}** a été débanni avec succès.",
                 color=discord.Color.green()
             )
             embed.add_field(name="Modérateur", value=interaction.user.mention, inline=True)
@@ -66,9 +70,13 @@ class BanManagementView(discord.ui.View):
             await interaction.response.send_message("❌ Seul la personne qui a ouvert ce menu peut utiliser ces boutons.", ephemeral=True)
             return
         
+        # A pending temp ban expiry no longer applies
+        if hasattr(interaction.client, 'temp_ban_scheduler'):
+            interaction.client.temp_ban_scheduler.cancel(self.guild.id, self.banned_user.id)
+        
         embed = discord.Embed(
             title="🔒 Ban Définitif Confirmé",
-            description=f"**{self.banned_user.user.display_name}** reste banni définitivement.",
+            description=f"**{self.banned_user.display_name}** reste banni définitivement.",
             color=discord.Color.red()
         )
         embed.add_field(name="Statut", value="Ban permanent maintenu", inline=True)
@@ -93,13 +101,8 @@ class BanManagementView(discord.ui.View):
         
         await interaction.response.edit_message(embed=embed, view=None)
         
-        # Wait 1 minute then delete the message
-        await asyncio.sleep(60)  # 60 seconds = 1 minute
-        try:
-            await interaction.delete_original_response()
-            logger.info("Message deleted after 1-minute delay (cancel action)")
-        except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
-            logger.warning(f"Could not delete message after cancel: {e}")
+        # Delete the message in 1 minute from the shared deletion queue (survives restarts)
+        interaction.client.deletion_queue.schedule(interaction.message, delay=60)
 
 class TempBanModal(discord.ui.Modal):
     """Modal for setting temporary ban duration"""
@@ -145,22 +148,26 @@ class TempBanModal(discord.ui.Modal):
             await interaction.response.defer()
             
             # First unban the user
-            await self.guild.unban(self.banned_user.user, reason="Conversion en ban temporaire")
+            await self.guild.unban(self.banned_user, reason="Conversion en ban temporaire")
             
             # Then ban them again with new reason
             reason_text = self.reason.value or "Ban temporaire"
-            temp_reason = f"{reason_text} (Expire le {unban_time.strftime('%d/%m/%Y %H:%M')})"
+            temp_reason = format_expiry_reason(reason_text, unban_time)
             
             await self.guild.ban(
-                self.banned_user.user, 
+                self.banned_user, 
                 reason=temp_reason,
                 delete_message_days=0
             )
             
+            # Unban automatically once the duration is over (persisted across restarts)
+            if hasattr(interaction.client, 'temp_ban_scheduler'):
+                interaction.client.temp_ban_scheduler.schedule(self.guild.id, self.banned_user.id, unban_time)
+            
             # Create success embed
             embed = discord.Embed(
                 title="⏰ Ban Temporaire Appliqué",
-                description=f"**{self.banned_user.user.display_name}** a été converti en ban temporaire.",
+                description=f"**{self.banned_user.display_name}** a été converti en ban temporaire.",
                 color=discord.Color.orange()
             )
             embed.add_field(name="Durée", value=duration_str, inline=True)
@@ -170,7 +177,7 @@ class TempBanModal(discord.ui.Modal):
             if self.reason.value:
                 embed.add_field(name="Raison", value=self.reason.value, inline=False)
             
-            embed.set_footer(text="Créé par @Ninja Iyed • Note: Le déban automatique n'est pas inclus")
+            embed.set_footer(text="Créé par @Ninja Iyed • Déban automatique à l'expiration")
             
             await interaction.followup.edit_message(interaction.message.id, embed=embed, view=None)
             
@@ -228,8 +235,7 @@ class UserSelectDropdown(discord.ui.Select):
         
         # Create options for dropdown
         options = []
-        for i, ban_entry in enumerate(banned_users[:25]):  # Discord limit of 25 options
-            user = ban_entry.user
+        for i, user in enumerate(banned_users[:25]):  # Discord limit of 25 options
             # Truncate display name if too long
             display_name = user.display_name[:80] if len(user.display_name) > 80 else user.display_name
             options.append(
@@ -256,19 +262,26 @@ class UserSelectDropdown(discord.ui.Select):
         
         selected_user_id = int(self.values[0])
         
-        # Find the selected banned user
-        selected_ban = None
-        for ban_entry in self.banned_users:
-            if ban_entry.user.id == selected_user_id:
-                selected_ban = ban_entry
-                break
+        # Find the selected banned user in the shared ban cache
+        ban_cache = getattr(interaction.client, 'ban_cache', None)
+        if ban_cache and ban_cache.is_loaded(self.guild.id):
+            selected_ban = ban_cache.get_cached_ban(self.guild.id, selected_user_id)
+            if not selected_ban:
+                await interaction.response.send_message("❌ Cet utilisateur n'est plus banni.", ephemeral=True)
+                return
+        else:
+            selected_ban = None
+            for record in self.banned_users:
+                if record.id == selected_user_id:
+                    selected_ban = record
+                    break
         
         if not selected_ban:
             await interaction.response.send_message("❌ Utilisateur introuvable.", ephemeral=True)
             return
         
         # Create management embed
-        user = selected_ban.user
+        user = selected_ban
         embed = discord.Embed(
             title="⚙️ Gestion du Bannissement",
             description=f"Que souhaitez-vous faire avec **{user.display_name}** ?",
@@ -280,7 +293,7 @@ class UserSelectDropdown(discord.ui.Select):
         embed.add_field(name="Raison actuelle", value=selected_ban.reason or "Aucune raison", inline=False)
         
         if user.avatar:
-            embed.set_thumbnail(url=user.avatar.url)
+            embed.set_thumbnail(url=user.avatar_url)
         
         embed.set_footer(text="Créé par @Ninja Iyed")
         
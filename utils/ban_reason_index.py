@@ -0,0 +1,214 @@
+"""
+Ban Reason Index
+Local SQLite FTS5 full-text index over ban reasons and audit log reasons
+"""
+
+import sqlite3
+import atexit
+import threading
+import re
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+class BanReasonIndex:
+    """
+    Full-text index of ban reasons, searchable per guild
+
+    Writes run in order on a single worker thread, off the event loop. Searches
+    use their own connection: in WAL mode they read the last committed state
+    without waiting for a write in progress.
+    """
+
+    def __init__(self, db_file="ban_reasons.db"):
+        self.db_file = db_file
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS ban_reasons USING fts5(
+                ban_reason,
+                audit_reason,
+                tokenize = "unicode61 remove_diacritics 2"
+            );
+            CREATE TABLE IF NOT EXISTS ban_reason_rows (
+                rowid INTEGER PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                UNIQUE (guild_id, user_id)
+            );
+        """)
+        self.conn.commit()
+        self._db_lock = threading.Lock()  # Guards the write connection
+        self._reader = sqlite3.connect(self.db_file)  # Event loop thread only
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ban-reasons")
+        atexit.register(self.close)
+
+    def close(self):
+        """Finish the queued writes"""
+        self._writer.shutdown(wait=True)
+
+    def _write(self, description, statements):
+        """Run `statements(conn)` in a transaction on the writer thread"""
+        def run():
+            try:
+                with self._db_lock, self.conn:
+                    statements(self.conn)
+            except sqlite3.Error as e:
+                logger.error(f"Error {description}: {e}")
+        try:
+            return self._writer.submit(run)
+        except RuntimeError:
+            # Shutting down: write in the caller's thread
+            run()
+            return None
+
+    @staticmethod
+    def _rowid(conn, guild_id, user_id):
+        """Return the FTS rowid of a ban, or None"""
+        row = conn.execute(
+            "SELECT rowid FROM ban_reason_rows WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    @classmethod
+    def _upsert(cls, conn, guild_id, user_id, **reasons):
+        """Insert or update the reasons of a ban (without committing)"""
+        rowid = cls._rowid(conn, guild_id, user_id)
+        if rowid is None:
+            cursor = conn.execute(
+                "INSERT INTO ban_reason_rows (guild_id, user_id) VALUES (?, ?)",
+                (guild_id, user_id)
+            )
+            conn.execute(
+                "INSERT INTO ban_reasons (rowid, ban_reason, audit_reason) VALUES (?, ?, ?)",
+                (cursor.lastrowid, reasons.get("ban_reason"), reasons.get("audit_reason"))
+            )
+            return
+
+        current = conn.execute(
+            "SELECT ban_reason, audit_reason FROM ban_reasons WHERE rowid = ?", (rowid,)
+        ).fetchone() or (None, None)
+        ban_reason = reasons.get("ban_reason", current[0])
+        audit_reason = reasons.get("audit_reason", current[1])
+        if (ban_reason, audit_reason) == tuple(current):
+            return
+
+        # FTS5 rows are replaced rather than updated in place
+        conn.execute("DELETE FROM ban_reasons WHERE rowid = ?", (rowid,))
+        conn.execute(
+            "INSERT INTO ban_reasons (rowid, ban_reason, audit_reason) VALUES (?, ?, ?)",
+            (rowid, ban_reason, audit_reason)
+        )
+
+    def sync_guild(self, guild_id, ban_reasons, audit_reasons=None):
+        """
+        Queue the alignment of a guild's index with its current ban list
+
+        Runs on the writer thread; writes queued afterwards (live ban events)
+        are applied after it.
+
+        Args:
+            guild_id: ID of the guild
+            ban_reasons: Dictionary {user_id: ban reason} of every current ban
+            audit_reasons: Optional dictionary {user_id: audit log reason}
+        """
+        audit_reasons = audit_reasons or {}
+        self._write(
+            f"syncing ban reason index for guild {guild_id}",
+            lambda conn: self._sync_guild(conn, guild_id, ban_reasons, audit_reasons)
+        )
+
+    @staticmethod
+    def _sync_guild(conn, guild_id, ban_reasons, audit_reasons):
+        """Diff the guild against its indexed rows and apply the changes in bulk"""
+        indexed = {
+            user_id: (rowid, (ban_reason, audit_reason))
+            for rowid, user_id, ban_reason, audit_reason in conn.execute(
+                """
+                SELECT r.rowid, r.user_id, b.ban_reason, b.audit_reason FROM ban_reason_rows r
+                LEFT JOIN ban_reasons b ON b.rowid = r.rowid
+                WHERE r.guild_id = ?
+                """,
+                (guild_id,)
+            )
+        }
+
+        removed = [(indexed[user_id][0],) for user_id in indexed.keys() - ban_reasons.keys()]
+        new_users = [user_id for user_id in ban_reasons if user_id not in indexed]
+        changed = []
+        for user_id, reason in ban_reasons.items():
+            entry = indexed.get(user_id)
+            if entry is None:
+                continue
+            rowid, current = entry
+            wanted = (reason, audit_reasons.get(user_id, current[1]))
+            if wanted != current:
+                changed.append((rowid, *wanted))
+
+        # FTS5 rows are replaced rather than updated in place
+        stale = removed + [(rowid,) for rowid, _, _ in changed]
+        conn.executemany("DELETE FROM ban_reasons WHERE rowid = ?", stale)
+        conn.executemany("DELETE FROM ban_reason_rows WHERE rowid = ?", removed)
+        conn.executemany(
+            "INSERT INTO ban_reason_rows (guild_id, user_id) VALUES (?, ?)",
+            [(guild_id, user_id) for user_id in new_users]
+        )
+        if new_users:
+            rowids = dict(conn.execute(
+                "SELECT user_id, rowid FROM ban_reason_rows WHERE guild_id = ?", (guild_id,)
+            ))
+            changed += [
+                (rowids[user_id], ban_reasons[user_id], audit_reasons.get(user_id))
+                for user_id in new_users
+            ]
+        conn.executemany(
+            "INSERT INTO ban_reasons (rowid, ban_reason, audit_reason) VALUES (?, ?, ?)",
+            changed
+        )
+
+    def set_ban_reason(self, guild_id, user_id, reason):
+        """Index the reason of a new ban"""
+        self._write("indexing ban reason", lambda conn: self._upsert(conn, guild_id, user_id, ban_reason=reason))
+
+    def set_audit_reason(self, guild_id, user_id, reason):
+        """Index the audit log reason of a ban"""
+        self._write("indexing audit reason", lambda conn: self._upsert(conn, guild_id, user_id, audit_reason=reason))
+
+    def remove(self, guild_id, user_id):
+        """Remove a ban from the index after an unban"""
+        def delete(conn):
+            rowid = self._rowid(conn, guild_id, user_id)
+            if rowid is not None:
+                conn.execute("DELETE FROM ban_reasons WHERE rowid = ?", (rowid,))
+                conn.execute("DELETE FROM ban_reason_rows WHERE rowid = ?", (rowid,))
+        self._write("removing ban reason", delete)
+
+    @staticmethod
+    def build_query(text):
+        """Turn free text into an FTS5 query matching every word as a prefix"""
+        words = re.findall(r"\w+", text.lower())
+        return " ".join(f'"{word}"*' for word in words)
+
+    def search(self, guild_id, text, limit=None, offset=0):
+        """Return the IDs of the banned users whose reasons match, best first"""
+        query = self.build_query(text)
+        if not query:
+            return []
+
+        try:
+            rows = self._reader.execute(
+                """
+                SELECT r.user_id FROM ban_reasons
+                JOIN ban_reason_rows r ON r.rowid = ban_reasons.rowid
+                WHERE ban_reasons MATCH ? AND r.guild_id = ?
+                ORDER BY bm25(ban_reasons)
+                LIMIT ? OFFSET ?
+                """,
+                (query, guild_id, limit if limit is not None else -1, offset)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error searching ban reasons: {e}")
+            return []
+        return [user_id for (user_id,) in rows]
@@ -0,0 +1,97 @@
+"""
+Ban Records
+Compact __slots__ records kept instead of discord.BanEntry/User objects
+"""
+
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+CDN_URL = "https://cdn.discordapp.com"
+
+class BanRecord:
+    """Compact ban entry: the few user fields the ban list actually displays"""
+
+    __slots__ = ("id", "name", "display_name", "avatar", "reason")
+
+    def __init__(self, id, name, display_name, avatar, reason):
+        self.id = id
+        self.name = name
+        self.display_name = display_name
+        self.avatar = avatar  # Avatar hash, None for the default avatar
+        self.reason = reason
+
+    @classmethod
+    def from_user(cls, user, reason=None):
+        """Build a record from a discord.User"""
+        return cls(
+            user.id,
+            user.name,
+            user.display_name,
+            user.avatar.key if user.avatar else None,
+            reason
+        )
+
+    @classmethod
+    def from_ban_entry(cls, ban_entry):
+        """Build a record from a discord.BanEntry"""
+        return cls.from_user(ban_entry.user, ban_entry.reason)
+
+    def with_reason(self, reason):
+        """Copy of the record with another reason"""
+        return BanRecord(self.id, self.name, self.display_name, self.avatar, reason)
+
+    @property
+    def mention(self):
+        return f"<@{self.id}>"
+
+    @property
+    def avatar_url(self):
+        """URL of the avatar, or of the default avatar"""
+        if self.avatar:
+            extension = "gif" if self.avatar.startswith("a_") else "png"
+            return f"{CDN_URL}/avatars/{self.id}/{self.avatar}.{extension}?size=1024"
+        return f"{CDN_URL}/embed/avatars/{(self.id >> 22) % 6}.png"
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"<BanRecord id={self.id} name={self.name!r}>"
+
+class BanAuditRecord:
+    """Compact audit attribution of a ban (who banned, when and why)"""
+
+    __slots__ = ("entry_id", "moderator_id", "moderator_name", "moderator_bot", "timestamp", "reason")
+
+    def __init__(self, entry_id, moderator_id, moderator_name, moderator_bot, timestamp, reason):
+        self.entry_id = entry_id
+        self.moderator_id = moderator_id
+        self.moderator_name = moderator_name
+        self.moderator_bot = moderator_bot
+        self.timestamp = timestamp
+        self.reason = reason
+
+    @classmethod
+    def from_row(cls, data):
+        """Build a record from its stored row"""
+        return cls(
+            data["entry_id"],
+            data["moderator_id"],
+            data["moderator_name"],
+            data["moderator_bot"],
+            datetime.fromisoformat(data["timestamp"]),
+            data["reason"]
+        )
+
+    def to_row(self):
+        """Stored row of the record"""
+        return {
+            "entry_id": self.entry_id,
+            "moderator_id": self.moderator_id,
+            "moderator_name": self.moderator_name,
+            "moderator_bot": self.moderator_bot,
+            "timestamp": self.timestamp.isoformat(),
+            "reason": self.reason
+        }
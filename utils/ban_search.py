@@ -0,0 +1,172 @@
+"""
+Ban Search Index
+Per-guild trigram/prefix index used by the /banlist search argument
+"""
+
+import bisect
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Ranks of the search results (lower is better)
+RANK_EXACT_ID = 0
+RANK_EXACT_NAME = 1
+RANK_PREFIX = 2
+RANK_SUBSTRING = 3
+RANK_NEAR = 4
+
+def _trigrams(text):
+    """Return the set of trigrams of a string"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _short_grams(text):
+    """Return the set of 1- and 2-character substrings of a string"""
+    return set(text) | {text[i:i + 2] for i in range(len(text) - 1)}
+
+class BanSearchIndex:
+    """Search index over the names and IDs of a guild's banned users"""
+
+    # Share of the query trigrams a term must contain to count as a near-match
+    NEAR_MATCH_RATIO = 0.5
+
+    def __init__(self):
+        self._terms = {}      # user_id -> tuple of searchable terms
+        self._trigrams = {}   # trigram -> set of user_ids (names only)
+        self._short = {}      # 1-2 character substring -> set of user_ids (names only)
+        self._sorted = []     # sorted (term, user_id) for prefix lookups
+
+    def __len__(self):
+        return len(self._terms)
+
+    @staticmethod
+    def terms_for(user):
+        """Searchable terms of a user: display name, username and ID"""
+        terms = {user.display_name.lower(), user.name.lower(), str(user.id)}
+        return tuple(term for term in terms if term)
+
+    def add(self, user):
+        """Index a banned user (replaces any previous entry)"""
+        if user.id in self._terms:
+            self.remove(user.id)
+
+        terms = self.terms_for(user)
+        self._terms[user.id] = terms
+        for term in terms:
+            bisect.insort(self._sorted, (term, user.id))
+            # IDs are served by the exact hash and the prefix list only: their
+            # digit trigrams are shared by every user and would not narrow anything
+            if not term.isdigit():
+                self._index_name(term, user.id)
+
+    def _index_name(self, term, user_id):
+        for trigram in _trigrams(term):
+            self._trigrams.setdefault(trigram, set()).add(user_id)
+        for gram in _short_grams(term):
+            self._short.setdefault(gram, set()).add(user_id)
+
+    def add_many(self, users, sort=True):
+        """Index many users at once, sorting the prefix list a single time"""
+        for user in users:
+            if user.id in self._terms:
+                self.remove(user.id)
+
+            terms = self.terms_for(user)
+            self._terms[user.id] = terms
+            for term in terms:
+                self._sorted.append((term, user.id))
+                if not term.isdigit():
+                    self._index_name(term, user.id)
+
+        if sort:
+            self._sorted.sort()
+
+    def remove(self, user_id):
+        """Remove a user from the index"""
+        terms = self._terms.pop(user_id, None)
+        if not terms:
+            return
+
+        for term in terms:
+            position = bisect.bisect_left(self._sorted, (term, user_id))
+            if position < len(self._sorted) and self._sorted[position] == (term, user_id):
+                del self._sorted[position]
+            if term.isdigit():
+                continue
+            for index, grams in ((self._trigrams, _trigrams(term)), (self._short, _short_grams(term))):
+                for gram in grams:
+                    postings = index.get(gram)
+                    if postings is not None:
+                        postings.discard(user_id)
+                        if not postings:
+                            del index[gram]
+
+    def search(self, query, limit=None):
+        """
+        Return user IDs matching a query, best matches first
+
+        Exact ID and exact name hits come first, then name prefixes,
+        substrings and finally near-matches sharing most trigrams.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        ranked = {}  # user_id -> (rank, tie-breaker)
+
+        def hit(user_id, rank, score=0.0):
+            best = ranked.get(user_id)
+            if best is None or (rank, score) < best:
+                ranked[user_id] = (rank, score)
+
+        # Exact ID
+        if query.isdigit() and int(query) in self._terms:
+            hit(int(query), RANK_EXACT_ID)
+
+        # Exact name and prefix matches from the sorted term list
+        position = bisect.bisect_left(self._sorted, (query, 0))
+        while position < len(self._sorted):
+            term, user_id = self._sorted[position]
+            if not term.startswith(query):
+                break
+            hit(user_id, RANK_EXACT_NAME if term == query else RANK_PREFIX, len(term))
+            position += 1
+
+        # Queries too short for trigrams: substring matches from the short-gram postings
+        if len(query) < 3 and not query.isdigit():
+            for user_id in self._short.get(query, ()):
+                matches = [term for term in self._terms[user_id] if query in term]
+                hit(user_id, RANK_SUBSTRING, min(len(term) for term in matches))
+
+        query_trigrams = _trigrams(query)
+        if query_trigrams and not query.isdigit():
+            postings = sorted(
+                (self._trigrams.get(trigram, set()) for trigram in query_trigrams),
+                key=len
+            )
+
+            # Substring matches: every query trigram must be present
+            if postings[0]:
+                candidates = set.intersection(*postings)
+                for user_id in candidates:
+                    matches = [term for term in self._terms[user_id] if query in term]
+                    if matches:
+                        hit(user_id, RANK_SUBSTRING, min(len(term) for term in matches))
+
+            # Near-matches: a user sharing `threshold` trigrams appears in at least
+            # one of the (n - threshold + 1) rarest postings, so only those are scanned
+            threshold = max(1, int(len(query_trigrams) * self.NEAR_MATCH_RATIO))
+            candidates = set()
+            for user_ids in postings[:len(postings) - threshold + 1]:
+                candidates.update(user_ids)
+            for user_id in candidates:
+                if user_id in ranked:
+                    continue
+                user_trigrams = set()
+                for term in self._terms[user_id]:
+                    user_trigrams |= _trigrams(term)
+                shared = len(query_trigrams & user_trigrams)
+                if shared >= threshold:
+                    hit(user_id, RANK_NEAR, -shared / len(query_trigrams))
+
+        results = sorted(ranked, key=lambda user_id: (ranked[user_id], user_id))
+        return results[:limit] if limit else results
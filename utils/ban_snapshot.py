@@ -0,0 +1,129 @@
+"""
+Ban Snapshot
+Immutable, versioned ban lists shared by views, with index-array selections
+rendered page by page through an LRU of built embeds
+"""
+
+import logging
+from array import array
+from collections import OrderedDict
+from utils.embeds import create_ban_list_embed
+
+logger = logging.getLogger(__name__)
+
+class BanSnapshot:
+    """Immutable version of a guild's ban list, shared by every view reading it"""
+
+    # Number of search selections memoized per snapshot
+    SELECTION_CACHE_SIZE = 32
+
+    def __init__(self, bans, guild_id, guild_name, version=0, audit_index=None, loading=False):
+        self.bans = tuple(bans)
+        self.guild_id = guild_id
+        self.guild_name = guild_name
+        self.version = version
+        self.audit_index = audit_index
+        self.loading = loading  # True while the ban list is still being fetched
+        self._positions = None  # user_id -> index in self.bans, built on first search
+        self._selections = OrderedDict()  # search key -> BanSelection
+        self.full_selection = BanSelection(self)
+
+    def __len__(self):
+        return len(self.bans)
+
+    def position_of(self, user_id):
+        """Index of a user in this snapshot, or None"""
+        if self._positions is None:
+            self._positions = {record.id: index for index, record in enumerate(self.bans)}
+        return self._positions.get(user_id)
+
+    def get_selection(self, search_term, find_user_ids, memoize=True):
+        """
+        Return the selection of a search, shared by every view running it
+
+        Args:
+            search_term: Search label, also used as the memoization key
+            find_user_ids: Callable returning the matching user IDs, best first
+            memoize: False for results that change without a new snapshot
+                version (reason searches: audit reasons keep being indexed)
+        """
+        selection = self._selections.get(search_term) if memoize else None
+        if selection is not None:
+            self._selections.move_to_end(search_term)
+            return selection
+
+        indices = array('I')
+        for user_id in find_user_ids():
+            position = self.position_of(user_id)
+            if position is not None:
+                indices.append(position)
+
+        selection = BanSelection(self, indices, search_term)
+        if not memoize:
+            return selection
+        self._selections[search_term] = selection
+        if len(self._selections) > self.SELECTION_CACHE_SIZE:
+            self._selections.popitem(last=False)
+        return selection
+
+class BanSelection:
+    """Bans displayed by a view: a whole snapshot or an index array over it"""
+
+    # Number of rendered page embeds kept per selection
+    PAGE_CACHE_SIZE = 16
+
+    def __init__(self, snapshot, indices=None, search_term=None):
+        self.snapshot = snapshot
+        self.indices = indices  # array of positions in snapshot.bans, None for all
+        self.search_term = search_term
+        self._pages = OrderedDict()  # (page, per_page, audit version) -> discord.Embed
+
+    def __len__(self):
+        return len(self.snapshot.bans) if self.indices is None else len(self.indices)
+
+    def __getitem__(self, key):
+        """Records of the selection, resolved through the index array"""
+        bans = self.snapshot.bans
+        if self.indices is None:
+            return bans[key]
+        if isinstance(key, slice):
+            return tuple(bans[index] for index in self.indices[key])
+        return bans[self.indices[key]]
+
+    @property
+    def loading(self):
+        return self.snapshot.loading
+
+    def total_pages(self, per_page):
+        """Number of pages for a page size"""
+        return (len(self) + per_page - 1) // per_page
+
+    def page_bans(self, page, per_page):
+        """Ban records displayed on a page"""
+        start_index = (page - 1) * per_page
+        return self[start_index:start_index + per_page]
+
+    def render_page(self, page, per_page):
+        """Return the embed of a page, building it only on a cache miss"""
+        audit_index = self.snapshot.audit_index
+        key = (page, per_page, audit_index.version if audit_index else 0)
+
+        embed = self._pages.get(key)
+        if embed is not None:
+            self._pages.move_to_end(key)
+            return embed
+
+        embed = create_ban_list_embed(
+            banned_users=self,
+            page=page,
+            per_page=per_page,
+            guild_name=self.snapshot.guild_name,
+            ban_info=audit_index.get_ban_info(self.snapshot.guild_id) if audit_index else None,
+            search_term=self.search_term,
+            loading=self.loading
+        )
+
+        self._pages[key] = embed
+        if len(self._pages) > self.PAGE_CACHE_SIZE:
+            self._pages.popitem(last=False)
+        return embed
@@ -0,0 +1,183 @@
+"""
+Deletion Queue
+Shared, persisted queue of delayed message deletions served by one timer task
+"""
+
+import discord
+import asyncio
+import heapq
+import time
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from utils.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+class DeletionQueue:
+    """Deletes bot messages after a delay, batching them per channel"""
+
+    # Messages deleted per bulk request (Discord limit)
+    BULK_LIMIT = 100
+    # Bulk deletion only accepts messages younger than 14 days
+    BULK_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+    # Extra wait after the first due message so neighbours join the same batch
+    BATCH_WINDOW = 1
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.storage = get_storage()
+        self._heap = []  # (due timestamp, channel_id, message_id)
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.stats = {
+            "scheduled": 0,
+            "deleted": 0,
+            "bulk_requests": 0,
+            "single_requests": 0,
+            "failed": 0
+        }
+        self.load_data()
+
+    def load_data(self):
+        """Load the pending deletions from storage"""
+        try:
+            for key, due_at in self.storage.load("pending_deletions").items():
+                channel_id, message_id = map(int, key.split(":"))
+                self._heap.append((due_at, channel_id, message_id))
+            heapq.heapify(self._heap)
+        except Exception as e:
+            logger.error(f"Error loading pending deletions: {e}")
+
+    def save_data(self, added=(), removed=()):
+        """Persist the (due, channel_id, message_id) items added to or removed from the queue"""
+        try:
+            with self.storage.transaction():
+                for due_at, channel_id, message_id in added:
+                    self.storage.put("pending_deletions", f"{channel_id}:{message_id}", due_at)
+                for _, channel_id, message_id in removed:
+                    self.storage.delete("pending_deletions", f"{channel_id}:{message_id}")
+        except Exception as e:
+            logger.error(f"Error saving pending deletions: {e}")
+
+    def __len__(self):
+        return len(self._heap)
+
+    def start(self):
+        """Start the timer task (once)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        """Stop the timer task (pending deletions stay on disk)"""
+        if self._task:
+            self._task.cancel()
+
+    def schedule(self, message, delay):
+        """
+        Delete a message after `delay` seconds
+
+        Args:
+            message: discord.Message (or any object with id and channel.id)
+            delay: Seconds before the deletion
+        """
+        self.schedule_id(message.channel.id, message.id, delay)
+
+    def schedule_id(self, channel_id, message_id, delay):
+        """Delete a message, known by its IDs, after `delay` seconds"""
+        item = (time.time() + delay, channel_id, message_id)
+        heapq.heappush(self._heap, item)
+        self.stats["scheduled"] += 1
+        self.save_data(added=[item])
+        self._wakeup.set()
+
+    def get_metrics(self):
+        """Counters and pending state exposed for monitoring"""
+        metrics = dict(self.stats)
+        metrics["pending"] = len(self._heap)
+        metrics["next_due_in"] = round(self._heap[0][0] - time.time(), 1) if self._heap else None
+        return metrics
+
+    async def _run(self):
+        """Sleep until the next deletion is due, then delete every due message"""
+        # Channels must be cached before deleting anything restored from disk
+        await self.bot.wait_until_ready()
+        while True:
+            try:
+                self._wakeup.clear()
+                if not self._heap:
+                    await self._wakeup.wait()
+                    continue
+
+                delay = self._heap[0][0] - time.time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                        continue  # Earlier deletion scheduled: recompute the delay
+                    except asyncio.TimeoutError:
+                        pass
+
+                await asyncio.sleep(self.BATCH_WINDOW)
+                await self._delete_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in deletion queue: {e}")
+                await asyncio.sleep(5)
+
+    async def _delete_due(self):
+        """Delete every due message, one bulk request per channel where possible"""
+        now = time.time()
+        by_channel = defaultdict(list)
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            item = heapq.heappop(self._heap)
+            due.append(item)
+            by_channel[item[1]].append(item[2])
+        if not due:
+            return
+        self.save_data(removed=due)
+
+        for channel_id, message_ids in by_channel.items():
+            await self._delete_channel_messages(channel_id, message_ids)
+
+    def _can_bulk_delete(self, channel, message_ids):
+        """Bulk deletion needs several recent messages and Manage Messages"""
+        if len(message_ids) < 2 or not hasattr(channel, 'delete_messages'):
+            return False
+        guild = getattr(channel, 'guild', None)
+        if guild is None or not channel.permissions_for(guild.me).manage_messages:
+            return False
+        oldest = min(discord.utils.snowflake_time(message_id) for message_id in message_ids)
+        return discord.utils.utcnow() - oldest < self.BULK_MAX_AGE
+
+    async def _delete_channel_messages(self, channel_id, message_ids):
+        """Delete the due messages of one channel"""
+        channel = self.bot.get_channel(channel_id) or self.bot.get_partial_messageable(channel_id)
+
+        if self._can_bulk_delete(channel, message_ids):
+            for start in range(0, len(message_ids), self.BULK_LIMIT):
+                chunk = message_ids[start:start + self.BULK_LIMIT]
+                try:
+                    if len(chunk) == 1:
+                        await channel.get_partial_message(chunk[0]).delete()
+                        self.stats["single_requests"] += 1
+                    else:
+                        await channel.delete_messages([discord.Object(id=message_id) for message_id in chunk])
+                        self.stats["bulk_requests"] += 1
+                    self.stats["deleted"] += len(chunk)
+                except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
+                    self.stats["failed"] += len(chunk)
+                    logger.warning(f"Could not bulk delete {len(chunk)} message(s) in channel {channel_id}: {e}")
+            return
+
+        for message_id in message_ids:
+            try:
+                await channel.get_partial_message(message_id).delete()
+                self.stats["single_requests"] += 1
+                self.stats["deleted"] += 1
+            except discord.NotFound:
+                pass  # Already deleted
+            except (discord.Forbidden, discord.HTTPException) as e:
+                self.stats["failed"] += 1
+                logger.warning(f"Could not delete message {message_id} in channel {channel_id}: {e}")
@@ -5,20 +5,67 @@ Functions for creating Discord embeds for ban list display
 
 import discord
 from datetime import datetime
+from functools import lru_cache
 import logging
+import re
+from config import BOT_SIGNATURES
 
 logger = logging.getLogger(__name__)
 
-def create_ban_list_embed(banned_users, page, per_page, guild_name, ban_info=None, search_term=None):
+def _compile_signatures(signatures):
+    """
+    Compile the bot signature table into a single regex
+
+    Each alternative is wrapped in a lookahead so a match is reported at every
+    position; alternatives keep the table order, which is also their priority.
+    An empty table compiles to no pattern at all.
+    """
+    names = list(signatures.values())
+    if not names:
+        return None, names
+    alternatives = "|".join(
+        f"(?P<s{i}>{re.escape(indicator.lower())})" for i, indicator in enumerate(signatures)
+    )
+    return re.compile(f"(?=(?:{alternatives}))"), names
+
+_SIGNATURE_PATTERN, _SIGNATURE_NAMES = _compile_signatures(BOT_SIGNATURES)
+
+@lru_cache(maxsize=4096)
+def detect_bot_from_reason(reason):
+    """
+    Guess which bot banned a user from the ban reason text
+
+    Returns:
+        str: Bot name, "Un bot" for a generic mention of a bot, or None
+    """
+    reason_lower = reason.lower()
+    best = None
+    matches = _SIGNATURE_PATTERN.finditer(reason_lower) if _SIGNATURE_PATTERN else ()
+    for match in matches:
+        priority = int(match.lastgroup[1:])
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
+
+    if best is not None:
+        return _SIGNATURE_NAMES[best]
+    if "bot" in reason_lower:
+        return "Un bot"
+    return None
+
+def create_ban_list_embed(banned_users, page, per_page, guild_name, ban_info=None, search_term=None, loading=False):
     """
     Create a Discord embed for displaying banned users list
 
     Args:
-        banned_users: List of discord.BanEntry objects
+        banned_users: Sequence of BanRecord objects
         page: Current page number
         per_page: Number of bans per page
         guild_name: Name of the guild/server
-        ban_info: Dictionary with audit log information
+        ban_info: Dictionary {user_id: BanAuditRecord} from the audit index
+        search_term: Search query shown in the title
+        loading: True while the rest of the ban list is still being fetched
 
     Returns:
         discord.Embed: Formatted embed with ban information
@@ -47,28 +94,26 @@ def create_ban_list_embed(banned_users, page, per_page, guild_name, ban_info=Non
     )
 
     # Add ban entries
-    for i, ban_entry in enumerate(page_bans, start=start_index + 1):
-        user = ban_entry.user
-        reason = ban_entry.reason
+    for i, user in enumerate(page_bans, start=start_index + 1):
+        reason = user.reason
 
         # Format user information with clickable profile picture thumbnail
-        avatar_url = user.avatar.url if user.avatar else user.default_avatar.url
-        user_info = f"**{user.display_name}** [🖼️]({avatar_url})\n"
+        user_info = f"**{user.display_name}** [🖼️]({user.avatar_url})\n"
         user_info += f"ID: `{user.id}`\n"
 
         # Add ban reason and moderator info from audit logs
         audit_info = ban_info.get(user.id) if ban_info else None
 
         if audit_info:
-            moderator = audit_info['moderator']
-            audit_reason = audit_info['reason']
-            ban_timestamp = audit_info['timestamp']
+            moderator_name = audit_info.moderator_name
+            audit_reason = audit_info.reason
+            ban_timestamp = audit_info.timestamp
 
             # Show who banned the user
-            if moderator.bot:
-                user_info += f"🤖 **Banni par le bot:** {moderator.display_name}\n"
+            if audit_info.moderator_bot:
+                user_info += f"🤖 **Banni par le bot:** {moderator_name}\n"
             else:
-                user_info += f"👮 **Banni par le modérateur:** {moderator.display_name}\n"
+                user_info += f"👮 **Banni par le modérateur:** {moderator_name}\n"
 
             # Show ban date
             user_info += f"**Date du ban:** {ban_timestamp.strftime('%d/%m/%Y %H:%M')}\n"
@@ -85,44 +130,9 @@ def create_ban_list_embed(banned_users, page, per_page, guild_name, ban_info=Non
                 user_info += f"**Raison:** {reason}\n"
 
                 # Try to identify if banned by a bot from reason text
-                bot_indicators = {
-                    "dyno": "Dyno",
-                    "carl-bot": "Carl-bot", 
-                    "carl bot": "Carl-bot",
-                    "mee6": "MEE6",
-                    "ticket tool": "Ticket Tool",
-                    "modmail": "ModMail",
-                    "automod": "AutoMod",
-                    "auto-mod": "AutoMod",
-                    "security": "Security Bot",
-                    "raid": "Anti-Raid Bot",
-                    "anti-raid": "Anti-Raid Bot",
-                    "pancake": "Pancake",
-                    "groovy": "Groovy",
-                    "rythm": "Rythm",
-                    "fredboat": "FredBoat",
-                    "pokecord": "Pokecord",
-                    "mudae": "Mudae",
-                    "dank memer": "Dank Memer",
-                    "tatsu": "Tatsu",
-                    "arcane": "Arcane",
-                    "epic rpg": "Epic RPG",
-                    "idle miner": "Idle Miner",
-                    "reaction": "Reaction Role Bot"
-                }
-
-                reason_lower = reason.lower()
-                detected_bot = None
-
-                for indicator, bot_name in bot_indicators.items():
-                    if indicator in reason_lower:
-                        detected_bot = bot_name
-                        break
-
+                detected_bot = detect_bot_from_reason(reason)
                 if detected_bot:
                     user_info += f"🤖 **Probablement banni par:** {detected_bot}\n"
-                elif "bot" in reason_lower:
-                    user_info += f"🤖 **Probablement banni par:** Un bot\n"
             else:
                 user_info += "**Raison:** Aucune raison fournie\n"
                 user_info += "⚠️ **Banni par:** Inconnu (pas d'accès aux logs d'audit)\n"
@@ -135,9 +145,14 @@ def create_ban_list_embed(banned_users, page, per_page, guild_name, ban_info=Non
         )
 
     # Add pagination info with watermark
-    embed.set_footer(
-        text=f"Page {page}/{total_pages} • Total: {len(banned_users)} bannis • Affichage: {len(page_bans)} bannis • Créé par @Ninja Iyed"
-    )
+    if loading:
+        embed.set_footer(
+            text=f"Page {page}/{total_pages}+ • Total: {len(banned_users)}+ bannis (chargement en cours…) • Affichage: {len(page_bans)} bannis • Créé par @Ninja Iyed"
+        )
+    else:
+        embed.set_footer(
+            text=f"Page {page}/{total_pages} • Total: {len(banned_users)} bannis • Affichage: {len(page_bans)} bannis • Créé par @Ninja Iyed"
+        )
 
     return embed
 
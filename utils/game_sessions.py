@@ -0,0 +1,93 @@
+"""
+Game Sessions
+Routes player input straight to the interactive game waiting for it
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+class GameSession:
+    """Event queue of one game, registered under (channel_id, user_id, message_id)"""
+
+    def __init__(self, router, channel_id, user_id, message_id=None, on_close=None):
+        self.router = router
+        self.channel_id = channel_id
+        self.user_id = user_id
+        self.message_id = message_id
+        self.on_close = on_close
+        self.closed = False
+        self._events = asyncio.Queue()
+
+    @property
+    def key(self):
+        return (self.channel_id, self.user_id, self.message_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def push(self, event):
+        """Deliver an event to the game (called by the router)"""
+        self._events.put_nowait(event)
+
+    async def next_event(self, timeout):
+        """Wait for the next event; raises asyncio.TimeoutError"""
+        return await asyncio.wait_for(self._events.get(), timeout=timeout)
+
+    def close(self):
+        """Unregister the session and run its cleanup (idempotent)"""
+        if self.closed:
+            return
+        self.closed = True
+        self.router._unregister(self)
+        if self.on_close:
+            self.on_close()
+
+class GameSessionRouter:
+    """O(1) dispatch of gateway events to the game sessions waiting for them"""
+
+    def __init__(self):
+        self._sessions = {}  # (channel_id, user_id, message_id) -> GameSession
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def open(self, channel_id, user_id, message_id=None, on_close=None):
+        """
+        Register a game session (use it as a context manager to close it on exit)
+
+        Args:
+            channel_id: Channel of the game
+            user_id: Player
+            message_id: Message the input is tied to, or None for channel messages
+            on_close: Called once when the session closes
+        """
+        session = GameSession(self, channel_id, user_id, message_id, on_close)
+        previous = self._sessions.get(session.key)
+        if previous is not None:
+            previous.close()  # Superseded: never leave two games on one key
+        self._register(session)
+        return session
+
+    def _register(self, session):
+        self._sessions[session.key] = session
+
+    def _unregister(self, session):
+        if self._sessions.get(session.key) is session:
+            del self._sessions[session.key]
+
+    def dispatch(self, channel_id, user_id, message_id, event):
+        """Hand an event to the matching session; returns False if none waits for it"""
+        session = self._sessions.get((channel_id, user_id, message_id))
+        if session is None:
+            return False
+        session.push(event)
+        return True
+
+    def dispatch_message(self, message):
+        """Route a channel message typed by a player"""
+        return self.dispatch(message.channel.id, message.author.id, None, message)
@@ -0,0 +1,418 @@
+"""
+Game Views
+Boutons des jeux interactifs: une seule réponse d'interaction par clic, sur un message réutilisé
+"""
+
+import discord
+import asyncio
+import random
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class GameView(discord.ui.View):
+    """Vue réservée au joueur, qui libère sa partie à la fin"""
+
+    def __init__(self, cog, user_id: int, guild_id, timeout: float):
+        super().__init__(timeout=timeout)
+        self.cog = cog
+        self.user_id = user_id
+        self.guild_id = guild_id
+        self.message = None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Seul le joueur peut répondre"""
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message(
+                "❌ Ce n'est pas votre partie!",
+                ephemeral=True
+            )
+            return False
+        return True
+
+    def finish(self):
+        """Terminer la partie: plus d'écoute des boutons, partie active libérée"""
+        self.stop()
+        active = self.cog.active_games.get(str(self.user_id))
+        if active and active.get('view') is self:
+            del self.cog.active_games[str(self.user_id)]
+
+    def disable_all(self):
+        for item in self.children:
+            item.disabled = True
+
+class MemoryGameView(GameView):
+    """Jeu de mémoire: séquence affichée puis reproduite avec les boutons du même message"""
+
+    EMOJIS = ["🔴", "🔵", "🟢", "🟡", "🟣", "🟠"]
+    MAX_LEVEL = 10
+
+    def __init__(self, cog, user_id: int, guild_id):
+        # Couvre l'affichage de la séquence (8 s au plus) et 30 s de réponse
+        super().__init__(cog, user_id, guild_id, timeout=45)
+        self.sequence = []
+        self.answer = []
+        self.level = 0
+        self.points = 0
+        for index, emoji in enumerate(self.EMOJIS):
+            button = discord.ui.Button(emoji=emoji, style=discord.ButtonStyle.secondary, row=index // 3)
+            button.callback = self._make_callback(emoji)
+            self.add_item(button)
+
+    def _make_callback(self, emoji):
+        async def callback(interaction: discord.Interaction):
+            await self.press(interaction, emoji)
+        return callback
+
+    def next_level(self):
+        """Allonger la séquence; les boutons restent grisés pendant l'affichage"""
+        self.level += 1
+        self.sequence.append(random.choice(self.EMOJIS))
+        self.answer = []
+        self.disable_all()
+
+    def show_embed(self, header=""):
+        embed = discord.Embed(
+            title=f"🧠 Niveau {self.level}",
+            description=f"{header}Mémorisez cette séquence:\n\n{' '.join(self.sequence)}",
+            color=0x9932CC
+        )
+        embed.set_footer(text=f"Cette séquence va disparaître dans {3 + self.level * 0.5:g} secondes...")
+        return embed
+
+    def input_embed(self):
+        embed = discord.Embed(
+            title=f"🧠 Niveau {self.level}",
+            description="Reproduisez la séquence en cliquant sur les boutons dans l'ordre!",
+            color=0x9932CC
+        )
+        embed.add_field(name="Progression", value=f"{' '.join(self.answer) or '—'} ({len(self.answer)}/{len(self.sequence)})", inline=True)
+        return embed
+
+    async def start(self, interaction: discord.Interaction):
+        """Afficher le premier niveau"""
+        self.next_level()
+        await interaction.response.send_message(embed=self.show_embed(), view=self)
+        self.message = await interaction.original_response()
+        await self.hide_sequence()
+
+    async def hide_sequence(self):
+        """Cacher la séquence après le délai d'affichage et activer les boutons"""
+        await asyncio.sleep(3 + self.level * 0.5)  # Plus de temps pour les niveaux élevés
+        if self.is_finished():
+            return
+        for item in self.children:
+            item.disabled = False
+        try:
+            await self.message.edit(embed=self.input_embed(), view=self)
+        except discord.HTTPException as e:
+            logger.warning(f"Could not hide memory sequence: {e}")
+            self.finish()
+
+    async def press(self, interaction: discord.Interaction, emoji: str):
+        """Un clic: une seule réponse d'interaction (édition du message)"""
+        if self.is_finished():
+            return
+        self.answer.append(emoji)
+
+        if self.answer != self.sequence[:len(self.answer)]:
+            embed = discord.Embed(
+                title="❌ Erreur!",
+                description=f"Séquence incorrecte au niveau {self.level}.\nVous avez gagné **{self.points}** points au total!",
+                color=0xFF0000
+            )
+            embed.add_field(name="Séquence correcte", value=" ".join(self.sequence), inline=False)
+            embed.add_field(name="Votre séquence", value=" ".join(self.answer), inline=False)
+            self.finish()
+            await interaction.response.edit_message(embed=embed, view=None)
+            return
+
+        if len(self.answer) < len(self.sequence):
+            await interaction.response.edit_message(embed=self.input_embed())
+            return
+
+        points = self.level * 5
+        self.points += points
+        self.cog.add_score(str(self.user_id), "memory", points, self.guild_id)
+
+        if self.level == self.MAX_LEVEL:
+            embed = discord.Embed(
+                title="🏆 PARFAIT!",
+                description=f"Vous avez terminé tous les niveaux!\nScore total: **{self.points}** points",
+                color=0xFFD700
+            )
+            self.finish()
+            await interaction.response.edit_message(embed=embed, view=None)
+            return
+
+        self.next_level()
+        header = f"✅ Niveau {self.level - 1} réussi! +{points} points\n\n"
+        await interaction.response.edit_message(embed=self.show_embed(header), view=self)
+        await self.hide_sequence()
+
+    async def on_timeout(self):
+        self.finish()
+        if self.message:
+            embed = discord.Embed(
+                title="⏰ Temps écoulé!",
+                description=f"Partie terminée au niveau {self.level}. **{self.points}** points gagnés.",
+                color=0xFF9900
+            )
+            try:
+                await self.message.edit(embed=embed, view=None)
+            except discord.HTTPException:
+                pass
+
+class QuizView(GameView):
+    """Une question du quiz: quatre boutons, résultat affiché dans le même message"""
+
+    LETTERS = ["A", "B", "C", "D"]
+
+    def __init__(self, cog, user_id: int, guild_id, question_index: int, points: int = 10):
+        super().__init__(cog, user_id, guild_id, timeout=30)
+        self.question_index = question_index
+        self.question = cog.quiz_bank.questions[question_index]
+        self.points = points
+        self.started = time.monotonic()
+        self.buttons = {}
+        for letter, option in zip(self.LETTERS, self.question["options"]):
+            button = discord.ui.Button(label=option[:80], style=discord.ButtonStyle.primary)
+            button.callback = self._make_callback(letter)
+            self.buttons[letter] = button
+            self.add_item(button)
+
+    def _make_callback(self, letter):
+        async def callback(interaction: discord.Interaction):
+            await self.answer(interaction, letter)
+        return callback
+
+    def reveal(self, chosen=None):
+        """Griser les boutons: bonne réponse en vert, mauvais choix en rouge"""
+        for letter, button in self.buttons.items():
+            button.disabled = True
+            if letter == self.question["correct"]:
+                button.style = discord.ButtonStyle.success
+            elif letter == chosen:
+                button.style = discord.ButtonStyle.danger
+            else:
+                button.style = discord.ButtonStyle.secondary
+
+    def result_embed(self, title, result, color):
+        embed = discord.Embed(
+            title=title,
+            description=f"{self.question['question']}\n\n{result}",
+            color=color
+        )
+        embed.add_field(name="💡 Explication", value=self.question["explanation"], inline=False)
+        return embed
+
+    async def answer(self, interaction: discord.Interaction, letter: str):
+        if self.is_finished():
+            return
+        self.finish()
+        self.reveal(letter)
+        correct = letter == self.question["correct"]
+        self.cog.record_quiz_results(self.question_index, [
+            (str(self.user_id), correct, time.monotonic() - self.started)
+        ])
+
+        if correct:
+            self.cog.add_score(str(self.user_id), "quiz", self.points, self.guild_id)
+            embed = self.result_embed("🎉 Correct!", f"Bonne réponse! +{self.points} points", 0x00FF00)
+        else:
+            embed = self.result_embed("❌ Incorrect!", f"La bonne réponse était: **{self.question['correct']}**", 0xFF0000)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    async def on_timeout(self):
+        self.reveal()
+        self.cog.record_quiz_results(self.question_index, [(str(self.user_id), False, None)])
+        if self.message:
+            embed = self.result_embed("⏰ Temps écoulé!", f"La bonne réponse était: **{self.question['correct']}**", 0xFF9900)
+            try:
+                await self.message.edit(embed=embed, view=self)
+            except discord.HTTPException:
+                pass
+
+class QuizRoundView(discord.ui.View):
+    """
+    Manche de quiz ouverte à tout le salon
+
+    Chaque membre répond une seule fois; les réponses restent en mémoire et ne
+    sont comptées qu'à la clôture, avec une seule écriture groupée des scores.
+    Le compteur de réponses du message est rafraîchi au plus une fois par
+    COUNTER_REFRESH secondes, quel que soit le nombre de clics.
+    """
+
+    LETTERS = QuizView.LETTERS
+    # Délai minimal entre deux éditions du compteur de réponses (secondes)
+    COUNTER_REFRESH = 2.0
+    # Gagnants cités dans le résultat (par ordre de réponse)
+    SHOWN_WINNERS = 10
+
+    def __init__(self, cog, guild_id, question_index: int, duration: int, points: int = 10, on_close=None):
+        # Clôture gérée par la manche: le timeout d'une vue est relancé à chaque clic
+        super().__init__(timeout=None)
+        self.cog = cog
+        self.guild_id = guild_id
+        self.question_index = question_index
+        self.question = cog.quiz_bank.questions[question_index]
+        self.duration = duration
+        self.points = points
+        self.on_close = on_close
+        self.answers = {}  # user_id -> lettre, dans l'ordre des réponses
+        self.answer_times = {}  # user_id -> secondes depuis la publication
+        self.started = None
+        self.closed = False
+        self.message = None
+        self.ends_at = None
+        self._refresh_task = None
+        self._close_task = None
+        self.buttons = {}
+        for letter, option in zip(self.LETTERS, self.question["options"]):
+            button = discord.ui.Button(label=option[:80], style=discord.ButtonStyle.primary)
+            button.callback = self._make_callback(letter)
+            self.buttons[letter] = button
+            self.add_item(button)
+
+    def _make_callback(self, letter):
+        async def callback(interaction: discord.Interaction):
+            await self.answer(interaction, letter)
+        return callback
+
+    def question_embed(self):
+        embed = discord.Embed(
+            title="👥 Quiz du Salon",
+            description=self.question["question"],
+            color=0x3498DB
+        )
+        bank = self.cog.quiz_bank
+        theme = bank.categories.get(self.question["category"], self.question["category"])
+        level = bank.difficulties.get(self.question["difficulty"], self.question["difficulty"])
+        embed.add_field(name="Thème", value=f"{theme} • {level}", inline=False)
+        embed.add_field(name="Options", value="\n".join(self.question["options"]), inline=False)
+        embed.add_field(name="Réponses", value=str(len(self.answers)), inline=True)
+        embed.add_field(name="Clôture", value=f"<t:{int(self.ends_at)}:R>", inline=True)
+        embed.set_footer(text=f"Une seule réponse par personne • {self.points} points par bonne réponse")
+        return embed
+
+    async def start(self, interaction: discord.Interaction):
+        """Publier la question et programmer la clôture"""
+        self.ends_at = discord.utils.utcnow().timestamp() + self.duration
+        self.started = time.monotonic()
+        await interaction.response.send_message(embed=self.question_embed(), view=self)
+        self.message = await interaction.original_response()
+        self._close_task = asyncio.create_task(self._close_after(self.duration))
+
+    async def _close_after(self, delay):
+        await asyncio.sleep(delay)
+        await self.close()
+
+    async def answer(self, interaction: discord.Interaction, letter: str):
+        """Un clic: réponse enregistrée en mémoire, confirmée au seul joueur"""
+        if self.closed:
+            await interaction.response.send_message("⏰ Cette manche est terminée!", ephemeral=True)
+            return
+
+        previous = self.answers.get(interaction.user.id)
+        if previous is not None:
+            await interaction.response.send_message(
+                f"❌ Vous avez déjà répondu **{previous}**!",
+                ephemeral=True
+            )
+            return
+
+        self.answers[interaction.user.id] = letter
+        self.answer_times[interaction.user.id] = time.monotonic() - self.started
+        await interaction.response.send_message(f"✅ Réponse **{letter}** enregistrée!", ephemeral=True)
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        """Regrouper les mises à jour du compteur en une édition différée"""
+        if self._refresh_task is None and not self.closed:
+            self._refresh_task = asyncio.create_task(self._refresh_counter())
+
+    async def _refresh_counter(self):
+        await asyncio.sleep(self.COUNTER_REFRESH)
+        # Les réponses arrivées pendant l'édition en programment une nouvelle
+        self._refresh_task = None
+        try:
+            await self.message.edit(embed=self.question_embed())
+        except discord.HTTPException as e:
+            logger.warning(f"Could not refresh quiz round counter: {e}")
+
+    def tally(self):
+        """Décompte par option et gagnants (dans l'ordre des réponses)"""
+        counts = dict.fromkeys(self.buttons, 0)
+        winners = []
+        correct = self.question["correct"]
+        for user_id, letter in self.answers.items():
+            counts[letter] += 1
+            if letter == correct:
+                winners.append(user_id)
+        return counts, winners
+
+    def result_embed(self, counts, winners):
+        total = len(self.answers)
+        lines = []
+        for letter, option in zip(self.buttons, self.question["options"]):
+            share = counts[letter] / total if total else 0
+            mark = "✅" if letter == self.question["correct"] else "▫️"
+            lines.append(f"{mark} {option} — **{counts[letter]}** ({share:.0%})")
+
+        embed = discord.Embed(
+            title="👥 Quiz du Salon — Résultats",
+            description=f"{self.question['question']}\n\n" + "\n".join(lines),
+            color=0x00FF00 if winners else 0xFF9900
+        )
+        if winners:
+            shown = ", ".join(f"<@{user_id}>" for user_id in winners[:self.SHOWN_WINNERS])
+            if len(winners) > self.SHOWN_WINNERS:
+                shown += f" et {len(winners) - self.SHOWN_WINNERS} autre(s)"
+            embed.add_field(
+                name=f"🎉 {len(winners)}/{total} bonne(s) réponse(s) • +{self.points} points",
+                value=shown,
+                inline=False
+            )
+        else:
+            embed.add_field(name="😶 Aucune bonne réponse", value=f"{total} participant(s)", inline=False)
+        embed.add_field(name="💡 Explication", value=self.question["explanation"], inline=False)
+        return embed
+
+    async def close(self):
+        """Clore la manche: décompte, scores en une écriture, résultat sur le même message"""
+        if self.closed:
+            return
+        self.closed = True
+        self.stop()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._close_task is not None and self._close_task is not asyncio.current_task():
+            self._close_task.cancel()
+
+        try:
+            counts, winners = self.tally()
+            if winners:
+                self.cog.add_scores({str(user_id): self.points for user_id in winners}, "quiz", self.guild_id)
+            if self.answers:
+                correct = self.question["correct"]
+                self.cog.record_quiz_results(self.question_index, [
+                    (str(user_id), letter == correct, self.answer_times[user_id])
+                    for user_id, letter in self.answers.items()
+                ])
+
+            for letter, button in self.buttons.items():
+                button.disabled = True
+                if letter == self.question["correct"]:
+                    button.style = discord.ButtonStyle.success
+                else:
+                    button.style = discord.ButtonStyle.secondary
+            if self.message:
+                try:
+                    await self.message.edit(embed=self.result_embed(counts, winners), view=self)
+                except discord.HTTPException as e:
+                    logger.warning(f"Could not show quiz round results: {e}")
+        finally:
+            if self.on_close:
+                self.on_close()
@@ -0,0 +1,66 @@
+"""
+Leaderboard
+Incrementally maintained score rankings with logarithmic rank queries
+"""
+
+from bisect import bisect_left, insort
+
+class Leaderboard:
+    """Players ordered by points (descending), updated one player at a time"""
+
+    def __init__(self):
+        self._points = {}  # user_id -> points
+        self._keys = []    # Sorted (-points, user_id)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def set(self, user_id, points):
+        """Move a player to their new score (players at 0 are not ranked)"""
+        old = self._points.get(user_id)
+        if old == points:
+            return
+        if old is not None:
+            del self._keys[bisect_left(self._keys, (-old, user_id))]
+            del self._points[user_id]
+        if points > 0:
+            insort(self._keys, (-points, user_id))
+            self._points[user_id] = points
+
+    def add(self, user_id, points):
+        """Add points to a player"""
+        self.set(user_id, self._points.get(user_id, 0) + points)
+
+    def get(self, user_id):
+        """Points of a player"""
+        return self._points.get(user_id, 0)
+
+    def rank(self, user_id):
+        """Rank of a player (1-based, ties share the best rank), or None if unranked"""
+        points = self._points.get(user_id)
+        if points is None:
+            return None
+        # "" sorts before any user ID: position of the first player with these points
+        return bisect_left(self._keys, (-points, "")) + 1
+
+    def top(self, k):
+        """The k best players as [(user_id, points)]"""
+        return [(user_id, -points) for points, user_id in self._keys[:k]]
+
+class ScoreBoards:
+    """Total ranking plus one ranking per game"""
+
+    def __init__(self):
+        self.total = Leaderboard()
+        self.games = {}  # game -> Leaderboard
+
+    def add(self, user_id, game, points):
+        """Record points won by a player in a game"""
+        self.total.add(user_id, points)
+        self.games.setdefault(game, Leaderboard()).add(user_id, points)
+
+    def board(self, game=None):
+        """Ranking of a game, or the total ranking"""
+        if game is None:
+            return self.total
+        return self.games.get(game) or Leaderboard()
@@ -7,10 +7,9 @@ Gestion avancée des logs avec configuration Discord
 import discord
 from discord.ext import commands
 import logging
-import json
-import os
 from datetime import datetime
 from typing import Optional, Dict, Any
+from utils.storage import get_storage
 from config import BOT_CONFIG
 
 class LoggingSystem:
@@ -18,16 +17,14 @@ class LoggingSystem:
     
     def __init__(self, bot):
         self.bot = bot
-        self.config_file = "logging_config.json"
+        self.storage = get_storage()
         self.load_config()
     
     def load_config(self):
         """Charger la configuration des logs"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
-            else:
+            self.config = self.storage.load("logging_config")
+            if not self.config:
                 # Configuration par défaut
                 self.config = {
                     "enabled": False,
@@ -54,8 +51,7 @@ class LoggingSystem:
     def save_config(self):
         """Sauvegarder la configuration des logs"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            self.storage.replace("logging_config", self.config)
         except Exception as e:
             logging.error(f"Erreur lors de la sauvegarde de la config logs: {e}")
     
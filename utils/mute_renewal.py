@@ -0,0 +1,272 @@
+"""
+Mute Renewal Scheduler
+Persisted renewal table for mutes longer than Discord's 28-day timeout limit
+"""
+
+import discord
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from utils.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+# Longest timeout accepted by Discord
+MAX_TIMEOUT = timedelta(days=28)
+
+class MuteRenewalScheduler:
+    """Re-applies the timeout of extended mutes before it runs out, from one task"""
+
+    # Renew this long before the applied timeout ends
+    RENEW_MARGIN = timedelta(days=1)
+    # Pause between two timeout re-applications of a batch (rate limits)
+    RENEWAL_SPACING = 1
+    # Maximum number of re-applications per wake-up
+    BATCH_SIZE = 50
+    # Delay before retrying a member that could not be renewed
+    RETRY_DELAY = timedelta(hours=1)
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.storage = get_storage()
+        # "guild_id:user_id" -> {"until": end timestamp or None, "applied_until": ts, "renew_at": ts, "reason": str}
+        self.renewals = self.load_data()
+        self._dirty = set()  # Keys changed since the last save
+        self._heap = [(entry["renew_at"], key) for key, entry in self.renewals.items()]
+        heapq.heapify(self._heap)
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def load_data(self):
+        """Load the renewal table from storage"""
+        try:
+            return self.storage.load("mute_renewals")
+        except Exception as e:
+            logger.error(f"Error loading mute renewals: {e}")
+        return {}
+
+    def save_data(self):
+        """Write the entries changed since the last save (one row each)"""
+        try:
+            with self.storage.transaction():
+                for key in self._dirty:
+                    if key in self.renewals:
+                        self.storage.put("mute_renewals", key, self.renewals[key])
+                    else:
+                        self.storage.delete("mute_renewals", key)
+            self._dirty.clear()
+        except Exception as e:
+            logger.error(f"Error saving mute renewals: {e}")
+
+    def _drop(self, key):
+        """Remove an entry (without saving)"""
+        if self.renewals.pop(key, None) is not None:
+            self._dirty.add(key)
+            return True
+        return False
+
+    @staticmethod
+    def _key(guild_id, user_id):
+        return f"{guild_id}:{user_id}"
+
+    def __len__(self):
+        return len(self.renewals)
+
+    def __contains__(self, member):
+        return self._key(member.guild.id, member.id) in self.renewals
+
+    def start(self):
+        """Start the renewal task (once)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        """Stop the renewal task"""
+        if self._task:
+            self._task.cancel()
+
+    def _set_renew_at(self, key, renew_at):
+        """Reschedule the next renewal of an entry (without saving)"""
+        self.renewals[key]["renew_at"] = renew_at
+        self._dirty.add(key)
+        heapq.heappush(self._heap, (renew_at, key))
+
+    def _next_renewal(self, applied_until):
+        """Timestamp of the renewal following a timeout ending at applied_until"""
+        return (applied_until - self.RENEW_MARGIN).timestamp()
+
+    def register(self, member, applied_until, reason, until=None):
+        """
+        Keep a member muted beyond the 28-day limit
+
+        Args:
+            member: Muted member
+            applied_until: End of the timeout that was just applied
+            reason: Reason used for the re-applications
+            until: End of the mute, or None for a permanent mute
+        """
+        key = self._key(member.guild.id, member.id)
+        self.renewals[key] = {
+            "until": until.timestamp() if until else None,
+            "applied_until": applied_until.timestamp(),
+            "renew_at": 0,
+            "reason": reason
+        }
+        self._set_renew_at(key, self._next_renewal(applied_until))
+        self.save_data()
+        self._wakeup.set()
+
+    def cancel(self, guild_id, user_id):
+        """Stop renewing the mute of a member (unmuted)"""
+        if self._drop(self._key(guild_id, user_id)):
+            self.save_data()
+
+    def reconcile(self, guild):
+        """
+        Align the table of a guild with the actual timeouts after a restart
+
+        Uses the member cache only: a timeout removed while the bot was offline
+        cancels the renewal, a timeout that lapsed is re-applied right away and
+        an existing one is renewed from its real end.
+        """
+        now = discord.utils.utcnow()
+        prefix = f"{guild.id}:"
+        changed = False
+        for key in [key for key in self.renewals if key.startswith(prefix)]:
+            entry = self.renewals[key]
+            member = guild.get_member(int(key[len(prefix):]))
+            if member is None:
+                continue  # Left the server: re-applied if they come back
+
+            if entry["until"] is not None and entry["until"] <= now.timestamp():
+                self._drop(key)
+                changed = True
+            elif member.timed_out_until and member.timed_out_until > now:
+                entry["applied_until"] = member.timed_out_until.timestamp()
+                self._set_renew_at(key, self._next_renewal(member.timed_out_until))
+                changed = True
+            elif entry["applied_until"] > now.timestamp():
+                # Our timeout should still run: a moderator removed it
+                self._drop(key)
+                changed = True
+            else:
+                # Lapsed while the bot was offline
+                self._set_renew_at(key, now.timestamp())
+                changed = True
+
+        if changed:
+            self.save_data()
+            self._wakeup.set()
+
+    async def on_member_join(self, member):
+        """Mute evasion: re-apply the mute of a member who left and came back"""
+        key = self._key(member.guild.id, member.id)
+        if key in self.renewals:
+            self._set_renew_at(key, discord.utils.utcnow().timestamp())
+            self._wakeup.set()
+
+    def on_member_update(self, before, after):
+        """Stop renewing when a moderator removes the timeout"""
+        key = self._key(after.guild.id, after.id)
+        entry = self.renewals.get(key)
+        if entry is None or not before.timed_out_until or after.timed_out_until:
+            return
+        if entry["applied_until"] > discord.utils.utcnow().timestamp():
+            self.cancel(after.guild.id, after.id)
+
+    async def _run(self):
+        """Sleep until the earliest renewal, re-apply every due timeout, repeat"""
+        while True:
+            try:
+                self._wakeup.clear()
+                delay = self._next_delay()
+                if delay is None:
+                    await self._wakeup.wait()
+                    continue
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                        continue  # Earlier renewal registered: recompute the delay
+                    except asyncio.TimeoutError:
+                        pass
+
+                await self._renew_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in mute renewal scheduler: {e}")
+                await asyncio.sleep(5)
+
+    def _next_delay(self):
+        """Seconds until the earliest live renewal, or None if there is none"""
+        while self._heap:
+            renew_at, key = self._heap[0]
+            entry = self.renewals.get(key)
+            if entry is not None and entry["renew_at"] == renew_at:
+                return renew_at - discord.utils.utcnow().timestamp()
+            heapq.heappop(self._heap)  # Cancelled or rescheduled
+        return None
+
+    async def _renew_due(self):
+        """Re-apply up to BATCH_SIZE due timeouts, spaced out for the rate limits"""
+        now = discord.utils.utcnow().timestamp()
+        batch = []
+        while self._heap and self._heap[0][0] <= now and len(batch) < self.BATCH_SIZE:
+            renew_at, key = heapq.heappop(self._heap)
+            entry = self.renewals.get(key)
+            if entry is not None and entry["renew_at"] == renew_at:
+                batch.append(key)
+
+        for index, key in enumerate(batch):
+            if index:
+                await asyncio.sleep(self.RENEWAL_SPACING)
+            if key in self.renewals:
+                await self._renew(key)
+
+        if batch:
+            self.save_data()
+            logger.info(f"Renewed {len(batch)} extended mute(s)")
+
+    async def _renew(self, key):
+        """Re-apply the timeout of one entry (without saving)"""
+        entry = self.renewals[key]
+        guild_id, user_id = map(int, key.split(":"))
+        now = discord.utils.utcnow()
+
+        if entry["until"] is not None and entry["until"] <= now.timestamp():
+            self._drop(key)
+            return
+
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            self._drop(key)
+            return
+
+        member = guild.get_member(user_id)
+        if member is None:
+            # Left the server: on_member_join re-applies the mute if they return
+            self._set_renew_at(key, (now + MAX_TIMEOUT).timestamp())
+            return
+
+        applied_until = now + MAX_TIMEOUT - timedelta(minutes=1)
+        if entry["until"] is not None:
+            applied_until = min(applied_until, datetime.fromtimestamp(entry["until"], tz=timezone.utc))
+
+        try:
+            await member.timeout(applied_until, reason=entry["reason"])
+        except discord.Forbidden:
+            logger.warning(f"No permission to extend mute for {member}")
+            self._drop(key)
+            return
+        except discord.HTTPException as e:
+            logger.error(f"Error extending mute for {member}: {e}")
+            self._set_renew_at(key, (now + self.RETRY_DELAY).timestamp())
+            return
+
+        entry["applied_until"] = applied_until.timestamp()
+        self._dirty.add(key)
+        if entry["until"] is not None and applied_until.timestamp() >= entry["until"]:
+            self._drop(key)  # Last stretch applied, Discord lifts it on time
+        else:
+            self._set_renew_at(key, self._next_renewal(applied_until))
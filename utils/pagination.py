@@ -6,8 +6,6 @@ Handles pagination view for ban list with navigation buttons
 import discord
 from discord.ext import commands
 import logging
-import asyncio
-from utils.embeds import create_ban_list_embed
 from utils.ban_management import UserSelectView
 
 logger = logging.getLogger(__name__)
@@ -15,21 +13,29 @@ logger = logging.getLogger(__name__)
 class PaginationView(discord.ui.View):
     """Discord UI View for handling pagination of ban list"""
     
-    def __init__(self, banned_users, current_page, per_page, guild_name, user_id, ban_info=None, search_term=None):
+    def __init__(self, selection, current_page, per_page, user_id):
         super().__init__(timeout=180)  # 3 minutes timeout
         
-        self.banned_users = banned_users
+        # Shared with every other view of the same list or search: never copied per view
+        self.selection = selection
         self.current_page = current_page
         self.per_page = per_page
-        self.guild_name = guild_name
         self.user_id = user_id
-        self.ban_info = ban_info
-        self.search_term = search_term
-        self.total_pages = (len(banned_users) + per_page - 1) // per_page
+        self.total_pages = selection.total_pages(per_page)
         
         # Update button states
         self.update_buttons()
     
+    def update_selection(self, selection):
+        """Switch to a newer selection, e.g. as more bans are fetched"""
+        self.selection = selection
+        self.total_pages = selection.total_pages(self.per_page)
+        self.update_buttons()
+    
+    def build_embed(self):
+        """Return the embed of the current page (rendered on demand, then cached)"""
+        return self.selection.render_page(self.current_page, self.per_page)
+    
     def update_buttons(self):
         """Update button states based on current page"""
         # Update previous button
@@ -40,9 +46,11 @@ class PaginationView(discord.ui.View):
         
         # Update page info button
         self.page_info.label = f"Page {self.current_page}/{self.total_pages}"
+        if self.selection.loading:
+            self.page_info.label += "+"
         
         # Hide navigation buttons if only one page
-        if self.total_pages <= 1:
+        if self.total_pages <= 1 and not self.selection.loading:
             self.previous_button.style = discord.ButtonStyle.secondary
             self.previous_button.disabled = True
             self.next_button.style = discord.ButtonStyle.secondary  
@@ -52,14 +60,7 @@ class PaginationView(discord.ui.View):
     async def update_embed(self, interaction: discord.Interaction):
         """Update the embed with current page data"""
         try:
-            embed = create_ban_list_embed(
-                banned_users=self.banned_users,
-                page=self.current_page,
-                per_page=self.per_page,
-                guild_name=self.guild_name,
-                ban_info=self.ban_info,
-                search_term=self.search_term
-            )
+            embed = self.build_embed()
             
             self.update_buttons()
             await interaction.response.edit_message(embed=embed, view=self)
@@ -130,8 +131,7 @@ class PaginationView(discord.ui.View):
             return
         
         # Get current page users for management
-        start_index = (self.current_page - 1) * self.per_page
-        current_page_users = self.banned_users[start_index:start_index + self.per_page]
+        current_page_users = list(self.selection.page_bans(self.current_page, self.per_page))
         
         if not current_page_users:
             await interaction.response.send_message("❌ Aucun utilisateur à gérer sur cette page.", ephemeral=True)
@@ -172,13 +172,8 @@ class PaginationView(discord.ui.View):
         await interaction.response.edit_message(embed=embed, view=None)
         self.stop()
         
-        # Wait 1 minute then delete the message
-        await asyncio.sleep(60)  # 60 seconds = 1 minute
-        try:
-            await interaction.delete_original_response()
-            logger.info("Message deleted after 1-minute delay (close button)")
-        except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
-            logger.warning(f"Could not delete message after close: {e}")
+        # Delete the message in 1 minute from the shared deletion queue (survives restarts)
+        interaction.client.deletion_queue.schedule(interaction.message, delay=60)
     
     async def on_timeout(self):
         """Called when the view times out - auto delete after 3 minutes"""
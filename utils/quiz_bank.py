@@ -0,0 +1,117 @@
+"""
+Quiz Bank
+Quiz questions loaded once from data/quiz_questions.json, indexed by category
+and difficulty, and per-player shuffled decks for non-repeating picks
+"""
+
+import json
+import os
+import random
+import logging
+
+logger = logging.getLogger(__name__)
+
+QUIZ_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "quiz_questions.json")
+
+class QuizBank:
+    """Question list plus index lists per category, difficulty and both"""
+
+    def __init__(self, questions, categories=None, difficulties=None):
+        self.questions = questions
+        self.categories = categories or {}      # key -> display name
+        self.difficulties = difficulties or {}  # key -> display name
+        self._index = {(None, None): list(range(len(questions)))}
+        for position, question in enumerate(questions):
+            category, difficulty = question["category"], question["difficulty"]
+            for key in ((category, None), (None, difficulty), (category, difficulty)):
+                self._index.setdefault(key, []).append(position)
+
+    @classmethod
+    def load(cls, path=QUIZ_FILE):
+        """Load the bank from its data file (empty bank on error)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            bank = cls(data["questions"], data.get("categories"), data.get("difficulties"))
+            logger.info(f"Loaded {len(bank)} quiz questions from {path}")
+            return bank
+        except Exception as e:
+            logger.error(f"Error loading quiz questions from {path}: {e}")
+            return cls([])
+
+    def __len__(self):
+        return len(self.questions)
+
+    def select(self, category=None, difficulty=None):
+        """Positions of the questions matching the filters (shared list, do not modify)"""
+        return self._index.get((category, difficulty), [])
+
+class QuizDeck:
+    """
+    Shuffled order of a question selection, drawn one card at a time
+
+    Only the seed, the position and the unread cards moved by look-ahead draws
+    are persisted: the order is rebuilt from the seed, and a new seed is drawn
+    once the deck is exhausted.
+    """
+
+    def __init__(self, indices, seed=None, position=0, overrides=()):
+        self.indices = indices
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.position = position
+        # Unread slots whose card differs from the seeded order: slot -> question
+        # (at most window - 1 of them, each is dropped once drawn)
+        self.overrides = {}
+        self._order = self._shuffle()
+        for slot, question in overrides:
+            if slot >= position:
+                self._order[slot] = question
+                self.overrides[slot] = question
+
+    def _shuffle(self):
+        order = list(self.indices)
+        random.Random(self.seed).shuffle(order)
+        return order
+
+    @classmethod
+    def from_state(cls, indices, state):
+        """Resume a persisted deck, or start a new one if the selection changed size"""
+        if not state or state.get("size") != len(indices):
+            return cls(indices)
+        return cls(indices, state["seed"], state["position"], state.get("overrides", ()))
+
+    def state(self):
+        """Compact persisted form"""
+        return {
+            "seed": self.seed,
+            "position": self.position,
+            "size": len(self.indices),
+            "overrides": [[slot, question] for slot, question in self.overrides.items()]
+        }
+
+    def draw(self, key=None, window=1):
+        """
+        Next question position (reshuffled once per full pass)
+
+        Args:
+            key: Optional cost of a question position; the cheapest of the next
+                `window` cards is drawn instead of the top one
+            window: Number of upcoming cards considered by `key`
+        """
+        if self.position >= len(self._order):
+            self.seed = random.getrandbits(32)
+            self.position = 0
+            self.overrides = {}
+            self._order = self._shuffle()
+        if key is not None and window > 1:
+            upcoming = self._order[self.position:self.position + window]
+            best = min(range(len(upcoming)), key=lambda offset: key(upcoming[offset]))
+            if best:
+                # The skipped top card takes the drawn card's slot
+                slot = self.position + best
+                self._order[self.position], self._order[slot] = self._order[slot], self._order[self.position]
+                self.overrides[slot] = self._order[slot]
+        question = self._order[self.position]
+        self.overrides.pop(self.position, None)
+        self.position += 1
+        return question
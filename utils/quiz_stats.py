@@ -0,0 +1,153 @@
+"""
+Quiz Stats
+Per-question answer counters kept in flat arrays (one slot per question of the
+bank) and persisted as a single compact row
+"""
+
+import base64
+import heapq
+import zlib
+import logging
+from array import array
+
+logger = logging.getLogger(__name__)
+
+class QuizStats:
+    """
+    Asked / answered / correct counters and total response time per question
+
+    Slots follow the positions of the QuizBank. Each question is fingerprinted
+    with the CRC32 of its text, so saved counters follow their question when
+    the bank file is edited and questions move.
+    """
+
+    NAMESPACE = "quiz_stats"
+    KEY = "questions"
+    # Expected success rate of a question that was never asked, per tagged difficulty
+    DIFFICULTY_PRIORS = {"facile": 0.8, "moyen": 0.6, "difficile": 0.4}
+    DEFAULT_PRIOR = 0.6
+    # Weight of the prior, in answers: the measured rate takes over as answers accumulate
+    PRIOR_WEIGHT = 5
+
+    def __init__(self, questions):
+        size = len(questions)
+        self.checksums = array('I', (zlib.crc32(question["question"].encode('utf-8')) for question in questions))
+        self.priors = array('d', (
+            self.DIFFICULTY_PRIORS.get(question["difficulty"], self.DEFAULT_PRIOR) for question in questions
+        ))
+        self.asked = array('I', bytes(4 * size))
+        self.answered = array('I', bytes(4 * size))
+        self.correct = array('I', bytes(4 * size))
+        self.time_total = array('d', bytes(8 * size))  # Seconds, over the answered questions
+
+    def __len__(self):
+        return len(self.asked)
+
+    @classmethod
+    def load(cls, storage, bank):
+        """Counters of the bank's questions, restored from storage"""
+        stats = cls(bank.questions)
+        try:
+            state = storage.get(cls.NAMESPACE, cls.KEY)
+            if state:
+                stats.restore(state)
+        except Exception as e:
+            logger.error(f"Error loading quiz stats: {e}")
+        return stats
+
+    def save(self, storage):
+        storage.put(self.NAMESPACE, self.KEY, self.state())
+
+    @staticmethod
+    def _encode(values):
+        return base64.b64encode(values.tobytes()).decode('ascii')
+
+    @staticmethod
+    def _decode(typecode, text):
+        values = array(typecode)
+        values.frombytes(base64.b64decode(text))
+        return values
+
+    def state(self):
+        """Compact persisted form: each array as base64 of its raw bytes"""
+        return {
+            "checksums": self._encode(self.checksums),
+            "asked": self._encode(self.asked),
+            "answered": self._encode(self.answered),
+            "correct": self._encode(self.correct),
+            "time_total": self._encode(self.time_total)
+        }
+
+    def restore(self, state):
+        """Load saved counters, matching questions by checksum"""
+        checksums = self._decode('I', state["checksums"])
+        saved = {
+            name: self._decode(self._typecode(name), state[name])
+            for name in ("asked", "answered", "correct", "time_total")
+        }
+        if checksums == self.checksums:
+            for name, values in saved.items():
+                setattr(self, name, values)
+            return
+
+        slots = {checksum: position for position, checksum in enumerate(self.checksums)}
+        moved = 0
+        for old_position, checksum in enumerate(checksums):
+            position = slots.get(checksum)
+            if position is None:
+                continue
+            for name, values in saved.items():
+                getattr(self, name)[position] = values[old_position]
+            moved += 1
+        logger.info(f"Quiz bank changed: kept stats of {moved}/{len(checksums)} questions")
+
+    @staticmethod
+    def _typecode(name):
+        return 'd' if name == "time_total" else 'I'
+
+    def record(self, position, correct, seconds=None):
+        """Count one answer (seconds=None: no answer before the timeout)"""
+        self.asked[position] += 1
+        if seconds is None:
+            return
+        self.answered[position] += 1
+        self.time_total[position] += seconds
+        if correct:
+            self.correct[position] += 1
+
+    def success_rate(self, position):
+        """Estimated success rate: measured rate smoothed towards the difficulty prior"""
+        return (self.correct[position] + self.PRIOR_WEIGHT * self.priors[position]) / \
+            (self.asked[position] + self.PRIOR_WEIGHT)
+
+    def totals(self, positions=None):
+        """Summed counters of some questions (all of them by default)"""
+        if positions is None:
+            return {
+                "asked": sum(self.asked),
+                "answered": sum(self.answered),
+                "correct": sum(self.correct),
+                "time_total": sum(self.time_total)
+            }
+        return {
+            "asked": sum(map(self.asked.__getitem__, positions)),
+            "answered": sum(map(self.answered.__getitem__, positions)),
+            "correct": sum(map(self.correct.__getitem__, positions)),
+            "time_total": sum(map(self.time_total.__getitem__, positions))
+        }
+
+    def extremes(self, positions, count, min_asked):
+        """(hardest, easiest) questions among those asked at least min_asked times"""
+        eligible = [position for position in positions if self.asked[position] >= min_asked]
+        rate = self.measured_rate
+        return heapq.nsmallest(count, eligible, key=rate), heapq.nlargest(count, eligible, key=rate)
+
+    def measured_rate(self, position):
+        """Raw success rate (correct answers / times asked)"""
+        asked = self.asked[position]
+        return self.correct[position] / asked if asked else 0.0
+
+    def mean_time(self, position):
+        """Mean response time in seconds, or None if never answered"""
+        answered = self.answered[position]
+        return self.time_total[position] / answered if answered else None
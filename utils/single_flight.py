@@ -0,0 +1,80 @@
+"""
+Single Flight
+Per-key coalescing of concurrent fetches, with a short-lived result cache
+"""
+
+import asyncio
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class SingleFlight:
+    """Run one fetch per key at a time and share its result with every caller"""
+
+    def __init__(self, ttl=0):
+        self.ttl = ttl           # Seconds a finished result is reused (0 to disable)
+        self._inflight = {}      # key -> asyncio.Task of the running fetch
+        self._results = {}       # key -> (expiry, result) of the last successful fetch
+        self.hits = 0            # Calls answered from a finished result
+        self.misses = 0          # Calls that started a new fetch
+        self.coalesced = 0       # Calls that joined a fetch already running
+
+    def get_task(self, key, factory):
+        """
+        Return the running fetch of a key, or start one
+
+        Args:
+            key: Key of the fetch (usually a guild ID)
+            factory: Callable returning the coroutine to run on a miss
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        self.misses += 1
+        task = asyncio.create_task(factory())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    def _finish(self, key, task):
+        """Forget a finished fetch, keeping its result for the TTL"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if self.ttl > 0 and not task.cancelled() and task.exception() is None:
+            self._results[key] = (time.monotonic() + self.ttl, task.result())
+
+    async def run(self, key, factory):
+        """Return a fresh cached result, or the result of the (shared) fetch"""
+        cached = self._results.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self.hits += 1
+                return cached[1]
+            del self._results[key]
+
+        # Shield the fetch so a cancelled caller does not abort it for the others
+        return await asyncio.shield(self.get_task(key, factory))
+
+    def is_running(self, key):
+        """Check if a fetch is in flight for a key"""
+        return key in self._inflight
+
+    def record_hit(self):
+        """Count a call answered by data the caller keeps itself"""
+        self.hits += 1
+
+    def invalidate(self, key):
+        """Drop the cached result of a key"""
+        self._results.pop(key, None)
+
+    def get_stats(self):
+        """Counters exposed for monitoring"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight)
+        }
@@ -0,0 +1,338 @@
+"""
+Storage
+Shared SQLite (WAL) key-value store with per-row upserts written off the event
+loop, and the one-shot migration of the legacy JSON state files
+"""
+
+import sqlite3
+import asyncio
+import threading
+import atexit
+import json
+import os
+import time
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Pending operation that deletes a row
+_DELETE = object()
+
+class Storage:
+    """
+    Rows of JSON values grouped by namespace, written one row at a time
+
+    Writes are serialized on the calling side and handed to a dedicated worker
+    thread, so disk I/O never runs on the event loop. Pending writes are
+    coalesced per row (the latest value wins) and committed in batches, one
+    transaction each.
+    """
+
+    # Batches slower than this (milliseconds) are logged as warnings
+    SLOW_BATCH_MS = 100
+
+    def __init__(self, db_file="bot_data.db"):
+        self.db_file = db_file
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS kv (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS migrations (
+                name TEXT PRIMARY KEY,
+                migrated_at TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+        self._db_lock = threading.Lock()  # Guards the connection
+        self._cond = threading.Condition()  # Guards everything below
+        # (namespace, key) -> serialized value or _DELETE; key None replaces a whole namespace
+        self._pending = {}
+        self._depth = 0  # Nesting level of transaction(), batches wait for it to close
+        self._submitted = 0
+        self._written = 0
+        self._closed = False
+        self.stats = {
+            "writes": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "rows": 0,
+            "errors": 0,
+            "last_batch_ms": 0.0,
+            "max_batch_ms": 0.0,
+            "total_batch_ms": 0.0
+        }
+        self._worker = threading.Thread(target=self._run, name="storage-writer", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    @contextmanager
+    def transaction(self):
+        """Keep several writes in the same batch (nested calls join the outer one)"""
+        with self._cond:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._cond:
+                self._depth -= 1
+                self._cond.notify_all()
+
+    def _submit(self, namespace, key, value):
+        """Queue a serialized write for the worker thread"""
+        with self._cond:
+            if (namespace, key) in self._pending:
+                self.stats["coalesced"] += 1
+                # Re-insert so the row keeps its place after the writes queued before it
+                del self._pending[(namespace, key)]
+            self._pending[(namespace, key)] = value
+            self._submitted += 1
+            self.stats["writes"] += 1
+            self._cond.notify_all()
+
+    def load(self, namespace):
+        """Return every row of a namespace as {key: value} (waits for pending writes)"""
+        self.flush_sync()
+        with self._db_lock:
+            rows = self.conn.execute(
+                "SELECT key, value FROM kv WHERE namespace = ?", (namespace,)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def get(self, namespace, key, default=None):
+        """Return one row, or `default` (waits for pending writes)"""
+        self.flush_sync()
+        with self._db_lock:
+            row = self.conn.execute(
+                "SELECT value FROM kv WHERE namespace = ? AND key = ?", (namespace, str(key))
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def put(self, namespace, key, value):
+        """Insert or update one row (snapshot taken now, written by the worker)"""
+        self._submit(namespace, str(key), json.dumps(value, ensure_ascii=False))
+
+    def put_many(self, namespace, items):
+        """Insert or update many rows in the same batch"""
+        with self.transaction():
+            for key, value in items:
+                self.put(namespace, key, value)
+
+    def delete(self, namespace, key):
+        """Delete one row"""
+        self._submit(namespace, str(key), _DELETE)
+
+    def replace(self, namespace, data):
+        """Make a namespace hold exactly `data` (for small config dictionaries)"""
+        with self._cond:
+            # Row writes queued for this namespace are superseded by the replacement
+            for pending in [pending for pending in self._pending if pending[0] == namespace]:
+                del self._pending[pending]
+                self.stats["coalesced"] += 1
+        rows = {str(key): json.dumps(value, ensure_ascii=False) for key, value in data.items()}
+        self._submit(namespace, None, rows)
+
+    async def flush(self):
+        """Wait until every write submitted so far is on disk"""
+        await asyncio.to_thread(self.flush_sync)
+
+    def flush_sync(self):
+        """Blocking flush, for shutdown and startup reads"""
+        with self._cond:
+            target = self._submitted
+            while self._written < target and not self._closed:
+                self._cond.wait()
+
+    def close(self):
+        """Write the pending rows and stop the worker thread"""
+        self.flush_sync()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout=5)
+
+    def get_stats(self):
+        """Write counters and batch timings exposed for monitoring"""
+        with self._cond:
+            stats = dict(self.stats)
+            stats["pending"] = len(self._pending)
+        stats["total_batch_ms"] = round(stats["total_batch_ms"], 2)
+        stats["avg_batch_ms"] = round(stats["total_batch_ms"] / stats["batches"], 2) if stats["batches"] else 0.0
+        return stats
+
+    def _run(self):
+        """Worker thread: commit the pending writes, one transaction per batch"""
+        while True:
+            with self._cond:
+                while not self._closed and (not self._pending or self._depth):
+                    self._cond.wait()
+                if not self._pending:
+                    return  # Closed and drained
+                batch, self._pending = self._pending, {}
+                submitted = self._submitted
+
+            started = time.perf_counter()
+            try:
+                with self._db_lock:
+                    with self.conn:
+                        rows = self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} storage row(s): {e}")
+                with self._cond:
+                    self.stats["errors"] += 1
+                    # Retry the batch; newer writes to the same rows win
+                    self._pending = {**batch, **self._pending}
+                    if self._closed:
+                        self._written = submitted
+                        self._cond.notify_all()
+                        return
+                time.sleep(1)
+                continue
+
+            elapsed = (time.perf_counter() - started) * 1000
+            with self._cond:
+                self._written = submitted
+                self.stats["batches"] += 1
+                self.stats["rows"] += rows
+                self.stats["last_batch_ms"] = round(elapsed, 2)
+                self.stats["max_batch_ms"] = round(max(self.stats["max_batch_ms"], elapsed), 2)
+                self.stats["total_batch_ms"] += elapsed
+                self._cond.notify_all()
+
+            if elapsed > self.SLOW_BATCH_MS:
+                logger.warning(f"Slow storage batch: {rows} row(s) in {elapsed:.1f} ms")
+            else:
+                logger.debug(f"Storage batch: {rows} row(s) in {elapsed:.1f} ms")
+
+    def _write_batch(self, batch):
+        """Apply a batch of pending writes (inside a transaction), return the row count"""
+        rows = 0
+        for (namespace, key), value in batch.items():
+            if key is None:
+                self.conn.execute("DELETE FROM kv WHERE namespace = ?", (namespace,))
+                self.conn.executemany(
+                    "INSERT INTO kv (namespace, key, value) VALUES (?, ?, ?)",
+                    [(namespace, row_key, row_value) for row_key, row_value in value.items()]
+                )
+                rows += len(value)
+            elif value is _DELETE:
+                self.conn.execute("DELETE FROM kv WHERE namespace = ? AND key = ?", (namespace, key))
+                rows += 1
+            else:
+                self.conn.execute(
+                    """
+                    INSERT INTO kv (namespace, key, value) VALUES (?, ?, ?)
+                    ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value
+                    """,
+                    (namespace, key, value)
+                )
+                rows += 1
+        return rows
+
+    def has_migrated(self, name):
+        """Whether a one-shot migration already ran"""
+        with self._db_lock:
+            return self.conn.execute("SELECT 1 FROM migrations WHERE name = ?", (name,)).fetchone() is not None
+
+    def record_migration(self, name):
+        """Mark a one-shot migration as done, once its rows are queued"""
+        self.flush_sync()
+        with self._db_lock:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO migrations (name, migrated_at) VALUES (?, ?)",
+                    (name, datetime.now().isoformat())
+                )
+
+    def migrate_json(self, name, path, rows):
+        """
+        Import a legacy JSON file once
+
+        The file is left in place (some are tracked by git); the migrations
+        table keeps it from being imported again.
+
+        Args:
+            name: Unique name of the migration
+            path: JSON file to import
+            rows: Callable turning the file content into (namespace, key, value) rows
+        """
+        if self.has_migrated(name):
+            return
+        if not os.path.exists(path):
+            return
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Written synchronously in one transaction: runs once, before anything reads the rows
+            with self._db_lock:
+                with self.conn:
+                    count = 0
+                    for namespace, key, value in rows(data):
+                        self.conn.execute(
+                            "INSERT OR REPLACE INTO kv (namespace, key, value) VALUES (?, ?, ?)",
+                            (namespace, str(key), json.dumps(value, ensure_ascii=False))
+                        )
+                        count += 1
+                    self.conn.execute(
+                        "INSERT INTO migrations (name, migrated_at) VALUES (?, ?)",
+                        (name, datetime.now().isoformat())
+                    )
+            logger.info(f"Migrated {path} to SQLite: {count} rows (the file is no longer read)")
+        except Exception as e:
+            logger.error(f"Error migrating {path} to SQLite: {e}")
+
+def _dict_rows(namespace):
+    """Rows of a JSON object: one row per top-level key"""
+    return lambda data: ((namespace, key, value) for key, value in data.items())
+
+def _ban_audit_rows(data):
+    for guild_id, guild_data in data.items():
+        entries = guild_data.pop("entries", {})
+        yield "ban_audit_guilds", guild_id, guild_data
+        for target_id, entry in entries.items():
+            yield "ban_audit_entries", f"{guild_id}:{target_id}", entry
+
+def _temp_ban_rows(data):
+    for key, expires_at in data.get("expiries", {}).items():
+        yield "temp_ban_expiries", key, expires_at
+    for key, expires_at in data.get("cancelled", {}).items():
+        yield "temp_ban_cancelled", key, expires_at
+
+def _pending_deletion_rows(data):
+    for due_at, channel_id, message_id in data:
+        yield "pending_deletions", f"{channel_id}:{message_id}", due_at
+
+# Legacy JSON state files: (migration name, file, row mapping)
+LEGACY_JSON_FILES = [
+    ("guardian_data", "guardian_data.json", _dict_rows("guardian")),
+    ("game_scores", "game_scores.json", _dict_rows("game_scores")),
+    ("temp_channels", "temp_channels.json", _dict_rows("temp_channels")),
+    ("logging_config", "logging_config.json", _dict_rows("logging_config")),
+    ("update_config", "update_config.json", _dict_rows("update_config")),
+    ("ban_audit_index", "ban_audit_index.json", _ban_audit_rows),
+    ("temp_bans", "temp_bans.json", _temp_ban_rows),
+    ("mute_renewals", "mute_renewals.json", _dict_rows("mute_renewals")),
+    ("pending_deletions", "pending_deletions.json", _pending_deletion_rows),
+]
+
+_storage = None
+_storage_lock = threading.Lock()  # The Flask thread may ask for it too
+
+def get_storage():
+    """Return the shared storage, migrating the legacy JSON files on first use"""
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            storage = Storage()
+            for name, path, rows in LEGACY_JSON_FILES:
+                storage.migrate_json(name, path, rows)
+            _storage = storage
+    return _storage
@@ -0,0 +1,257 @@
+"""
+Temp Ban Scheduler
+Persistent min-heap of temporary ban expiries, served by a single sleeping task
+"""
+
+import discord
+import asyncio
+import heapq
+import re
+import logging
+from datetime import datetime
+from utils.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+# Expiry marker written into the ban reason by TempBanModal
+EXPIRY_PATTERN = re.compile(r"\(Expire le (\d{2}/\d{2}/\d{4} \d{2}:\d{2})\)")
+EXPIRY_FORMAT = "%d/%m/%Y %H:%M"
+
+def format_expiry_reason(reason, unban_time):
+    """Append the expiry marker of a temporary ban to its reason"""
+    return f"{reason} (Expire le {unban_time.strftime(EXPIRY_FORMAT)})"
+
+def parse_expiry(reason):
+    """Return the expiry datetime written in a ban reason, or None"""
+    if not reason:
+        return None
+    matches = EXPIRY_PATTERN.findall(reason)
+    if not matches:
+        return None
+    try:
+        return datetime.strptime(matches[-1], EXPIRY_FORMAT)
+    except ValueError:
+        return None
+
+class TempBanScheduler:
+    """Unbans temporarily banned users on time, across restarts"""
+
+    # Slack (seconds) when matching a stored expiry with the minute-precision reason
+    REASON_TOLERANCE = 60
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.storage = get_storage()
+        self._expiries = {}   # (guild_id, user_id) -> expiry timestamp
+        self._cancelled = {}  # (guild_id, user_id) -> cancelled expiry, not revived from reasons
+        self._dirty = set()   # Keys changed since the last save
+        self._heap = []       # (due timestamp, guild_id, user_id, expiry), stale items skipped on pop
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.load_data()
+
+    def load_data(self):
+        """Load the pending expiries from storage"""
+        try:
+            for key, expires_at in self.storage.load("temp_ban_expiries").items():
+                guild_id, user_id = map(int, key.split(":"))
+                self._expiries[(guild_id, user_id)] = expires_at
+            for key, expires_at in self.storage.load("temp_ban_cancelled").items():
+                guild_id, user_id = map(int, key.split(":"))
+                self._cancelled[(guild_id, user_id)] = expires_at
+        except Exception as e:
+            logger.error(f"Error loading temp bans: {e}")
+
+        self._heap = [
+            (expires_at, guild_id, user_id, expires_at)
+            for (guild_id, user_id), expires_at in self._expiries.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def save_data(self):
+        """Write the users changed since the last save (one row each)"""
+        try:
+            with self.storage.transaction():
+                for key in self._dirty:
+                    row = f"{key[0]}:{key[1]}"
+                    for namespace, table in (("temp_ban_expiries", self._expiries),
+                                             ("temp_ban_cancelled", self._cancelled)):
+                        if key in table:
+                            self.storage.put(namespace, row, table[key])
+                        else:
+                            self.storage.delete(namespace, row)
+            self._dirty.clear()
+        except Exception as e:
+            logger.error(f"Error saving temp bans: {e}")
+
+    def __len__(self):
+        return len(self._expiries)
+
+    def start(self):
+        """Start the expiry task (once)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _push(self, guild_id, user_id, expires_at, due_at=None):
+        """Record an expiry without saving (due_at delays a retry past the expiry)"""
+        key = (guild_id, user_id)
+        self._expiries[key] = expires_at
+        self._cancelled.pop(key, None)
+        self._dirty.add(key)
+        heapq.heappush(self._heap, (due_at or expires_at, guild_id, user_id, expires_at))
+
+    def schedule(self, guild_id, user_id, unban_time):
+        """Unban a user of a guild at the given datetime"""
+        self._push(guild_id, user_id, unban_time.timestamp())
+        self.save_data()
+        # Wake the task in case this expiry is earlier than the one it sleeps on
+        self._wakeup.set()
+
+    def cancel(self, guild_id, user_id):
+        """Forget the expiry of a user (unbanned manually or made permanent)"""
+        key = (guild_id, user_id)
+        expires_at = self._expiries.pop(key, None)
+        if expires_at is None:
+            return
+        # Remember it so the startup rebuild does not revive it from the ban reason
+        self._cancelled[key] = expires_at
+        self._dirty.add(key)
+        self.save_data()
+
+    def get_expiry(self, guild_id, user_id):
+        """Return the pending expiry datetime of a user, or None"""
+        expires_at = self._expiries.get((guild_id, user_id))
+        return datetime.fromtimestamp(expires_at) if expires_at is not None else None
+
+    def rebuild_from_bans(self, guild_id, ban_records):
+        """
+        Recover the expiries of a guild from the "Expire le" marker of ban reasons
+
+        Args:
+            guild_id: ID of the guild
+            ban_records: Every current ban record of the guild
+        """
+        banned = {}
+        for record in ban_records:
+            expiry = parse_expiry(record.reason)
+            if expiry:
+                banned[record.id] = expiry.timestamp()
+
+        changed = False
+        for key in [key for key in self._expiries if key[0] == guild_id and key[1] not in banned]:
+            # Unbanned while the bot was offline
+            del self._expiries[key]
+            self._dirty.add(key)
+            changed = True
+
+        for key in [key for key in self._cancelled if key[0] == guild_id]:
+            if abs(banned.get(key[1], float("inf")) - self._cancelled[key]) > self.REASON_TOLERANCE:
+                # Re-banned or unbanned since: the cancellation no longer applies
+                del self._cancelled[key]
+                self._dirty.add(key)
+                changed = True
+
+        recovered = 0
+        for user_id, expires_at in banned.items():
+            key = (guild_id, user_id)
+            if key in self._expiries or key in self._cancelled:
+                continue
+            self._push(guild_id, user_id, expires_at)
+            recovered += 1
+
+        if recovered or changed:
+            self.save_data()
+            self._wakeup.set()
+        if recovered:
+            logger.info(f"Recovered {recovered} temp ban expiries from ban reasons in guild {guild_id}")
+
+    async def _run(self):
+        """Sleep until the earliest expiry, unban every due user, repeat"""
+        while True:
+            try:
+                self._wakeup.clear()
+                delay = self._next_delay()
+                if delay is None:
+                    await self._wakeup.wait()
+                    continue
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                        continue  # New earlier expiry: recompute the delay
+                    except asyncio.TimeoutError:
+                        pass
+
+                due = self._pop_due()
+                if due:
+                    self.save_data()
+                for guild_id, user_id, expires_at in due:
+                    await self._expire(guild_id, user_id, expires_at)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in temp ban scheduler: {e}")
+                await asyncio.sleep(5)
+
+    def _next_delay(self):
+        """Seconds until the earliest live expiry, or None if there is none"""
+        while self._heap:
+            due_at, guild_id, user_id, expires_at = self._heap[0]
+            if self._expiries.get((guild_id, user_id)) == expires_at:
+                return due_at - datetime.now().timestamp()
+            heapq.heappop(self._heap)  # Cancelled or rescheduled
+        return None
+
+    def _pop_due(self):
+        """Remove and return every expiry that is due"""
+        now = datetime.now().timestamp()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, guild_id, user_id, expires_at = heapq.heappop(self._heap)
+            if self._expiries.get((guild_id, user_id)) == expires_at:
+                del self._expiries[(guild_id, user_id)]
+                self._dirty.add((guild_id, user_id))
+                due.append((guild_id, user_id, expires_at))
+        return due
+
+    async def _current_reason(self, guild, user_id):
+        """Return the current ban reason of a user, or None if not banned"""
+        ban_cache = getattr(self.bot, 'ban_cache', None)
+        if ban_cache and ban_cache.is_loaded(guild.id):
+            record = ban_cache.get_cached_ban(guild.id, user_id)
+            return record.reason if record else None
+        ban_entry = await guild.fetch_ban(discord.Object(id=user_id))
+        return ban_entry.reason
+
+    async def _expire(self, guild_id, user_id, expires_at):
+        """Unban a user whose temporary ban is over"""
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            logger.warning(f"Temp ban expired in unknown guild {guild_id}, dropped")
+            return
+
+        try:
+            # Only lift the ban if it is still the same temporary ban
+            expiry = parse_expiry(await self._current_reason(guild, user_id))
+            if expiry is None or abs(expiry.timestamp() - expires_at) > self.REASON_TOLERANCE:
+                logger.info(f"Temp ban of {user_id} in guild {guild_id} was replaced, not unbanning")
+                return
+
+            await guild.unban(discord.Object(id=user_id), reason="Ban temporaire expiré")
+            ban_cache = getattr(self.bot, 'ban_cache', None)
+            if ban_cache:
+                ban_cache.remove(guild_id, user_id)
+            logger.info(f"Temp ban of {user_id} expired in guild {guild_id}: unbanned")
+        except discord.NotFound:
+            pass  # Already unbanned
+        except discord.Forbidden:
+            logger.warning(f"Missing permission to lift temp ban of {user_id} in guild {guild_id}")
+        except discord.HTTPException as e:
+            # Retry later rather than leaving the user banned forever
+            logger.error(f"Error lifting temp ban of {user_id} in guild {guild_id}: {e}")
+            self._push(guild_id, user_id, expires_at, due_at=datetime.now().timestamp() + 60)
+            self.save_data()
+
+    def stop(self):
+        """Stop the expiry task"""
+        if self._task:
+            self._task.cancel()
@@ -7,10 +7,9 @@ Vérification automatique des nouvelles versions
 import discord
 from discord.ext import commands, tasks
 import aiohttp
-import json
-import os
 from datetime import datetime
 from typing import Optional, Dict, Any
+from utils.storage import get_storage
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,7 +19,7 @@ class UpdateNotifier:
     
     def __init__(self, bot):
         self.bot = bot
-        self.config_file = "update_config.json"
+        self.storage = get_storage()
         self.github_repo = "TifouDragon/slimboy-discord-bot"
         self.current_version = "2.3.1"  # Version 2.3.1
         self.load_config()
@@ -28,10 +27,8 @@ class UpdateNotifier:
     def load_config(self):
         """Charger la configuration des notifications"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
-            else:
+            self.config = self.storage.load("update_config")
+            if not self.config:
                 self.config = {
                     "enabled": False,
                     "notification_channel_id": None,
@@ -49,8 +46,7 @@ class UpdateNotifier:
     def save_config(self):
         """Sauvegarder la configuration"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            self.storage.replace("update_config", self.config)
         except Exception as e:
             logger.error(f"Erreur sauvegarde config update: {e}")
     